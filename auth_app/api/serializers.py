@@ -1,5 +1,9 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.db.models import Q
+
+
+USERNAME_TAKEN_MESSAGE = "This username is already taken."
 
 
 class RegistrationSerializer(serializers.Serializer):
@@ -18,12 +22,14 @@ class RegistrationSerializer(serializers.Serializer):
         username = attrs["username"]
         email = attrs["email"]
 
-        if User.objects.filter(username=username).exists():
+        taken = list(User.objects.filter(Q(username=username) | Q(email=email)).values_list("username", flat=True))
+
+        if username in taken:
             raise serializers.ValidationError(
-                {"username": "This username is already taken."}
+                {"username": USERNAME_TAKEN_MESSAGE}
             )
 
-        if User.objects.filter(email=email).exists():
+        if taken:
             raise serializers.ValidationError(
                 {"email": "This email is already in use."}
             )
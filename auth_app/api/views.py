@@ -1,72 +1,124 @@
+import json
+
+from asgiref.sync import sync_to_async
 from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
+from django.db import IntegrityError, close_old_connections, transaction
+from django.http import JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 
-from rest_framework.views import APIView
-from rest_framework.permissions import AllowAny
-from rest_framework.response import Response
-from rest_framework import status
 from rest_framework.authtoken.models import Token
 
+from auth_app.hashing import HashingPoolSaturated, hashing_pool
 from profiles_app.models import UserProfile
-from .serializers import RegistrationSerializer, LoginSerializer
+from .serializers import USERNAME_TAKEN_MESSAGE, RegistrationSerializer, LoginSerializer
 
 
-class RegistrationView(APIView):
-    permission_classes = [AllowAny]
+def parse_body(request):
+    """Returns the JSON or form payload of the request, or None if it cannot be parsed."""
+    if request.content_type == "application/json":
+        try:
+            return json.loads(request.body or b"{}")
+        except ValueError:
+            return None
+    return request.POST
 
-    def post(self, request):
-        serializer = RegistrationSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
 
-        user = User.objects.create_user(
-            username=serializer.validated_data["username"],
-            email=serializer.validated_data["email"],
-            password=serializer.validated_data["password"],
-        )
+def bad_request(data):
+    return JsonResponse(data, status=400)
 
-        UserProfile.objects.create(
-            user=user,
-            type=serializer.validated_data["type"],
-        )
 
-        token, _ = Token.objects.get_or_create(user=user)
+def busy_response():
+    response = JsonResponse({"detail": "The server is busy, please try again shortly."}, status=503)
+    response["Retry-After"] = "1"
+    return response
 
-        return Response(
-            {
-                "token": token.key,
-                "username": user.username,
-                "email": user.email,
-                "user_id": user.id,
-            },
-            status=status.HTTP_201_CREATED,
-        )
 
+def auth_response(user, token, status):
+    return JsonResponse(
+        {
+            "token": token.key,
+            "username": user.username,
+            "email": user.email,
+            "user_id": user.id,
+        },
+        status=status,
+    )
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class RegistrationView(View):
+    """Registers a user; the password is hashed on the bounded hashing pool, not the event loop."""
+
+    async def post(self, request):
+        data = parse_body(request)
+        if data is None:
+            return bad_request({"detail": "Malformed request body."})
+
+        serializer = RegistrationSerializer(data=data)
+        if not await sync_to_async(serializer.is_valid)():
+            return bad_request(serializer.errors)
 
-class LoginView(APIView):
-    permission_classes = [AllowAny]
+        try:
+            password_hash = await hashing_pool.run(make_password, serializer.validated_data["password"])
+        except HashingPoolSaturated:
+            return busy_response()
 
-    def post(self, request):
-        serializer = LoginSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
+        try:
+            user, token = await sync_to_async(self._create_account)(serializer.validated_data, password_hash)
+        except IntegrityError:
+            return bad_request({"username": [USERNAME_TAKEN_MESSAGE]})
+        return auth_response(user, token, status=201)
 
-        user = authenticate(
-            username=serializer.validated_data["username"],
-            password=serializer.validated_data["password"],
+    @transaction.atomic
+    def _create_account(self, data, password_hash):
+        """Writes user, profile and token in one transaction."""
+        user = User(
+            username=User.normalize_username(data["username"]),
+            email=User.objects.normalize_email(data["email"]),
+            password=password_hash,
         )
-        if not user:
-            return Response(
-                {"detail": "Invalid credentials."},
-                status=status.HTTP_400_BAD_REQUEST,
+        user.save()
+        UserProfile.objects.create(user=user, type=data["type"])
+        token = Token.objects.create(user=user)
+        return user, token
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class LoginView(View):
+    """Logs a user in; authenticate() runs on the bounded hashing pool, not the event loop."""
+
+    async def post(self, request):
+        data = parse_body(request)
+        if data is None:
+            return bad_request({"detail": "Malformed request body."})
+
+        serializer = LoginSerializer(data=data)
+        if not serializer.is_valid():
+            return bad_request(serializer.errors)
+
+        try:
+            user = await hashing_pool.run(
+                self._authenticate,
+                request,
+                serializer.validated_data["username"],
+                serializer.validated_data["password"],
             )
+        except HashingPoolSaturated:
+            return busy_response()
+
+        if user is None:
+            return bad_request({"detail": "Invalid credentials."})
+
+        token, _ = await Token.objects.aget_or_create(user=user)
+        return auth_response(user, token, status=200)
 
-        token, _ = Token.objects.get_or_create(user=user)
-
-        return Response(
-            {
-                "token": token.key,
-                "username": user.username,
-                "email": user.email,
-                "user_id": user.id,
-            },
-            status=status.HTTP_200_OK,
-        )
\ No newline at end of file
+    def _authenticate(self, request, username, password):
+        """Runs the authentication backends; pool threads see no request_finished, so the connection is released here."""
+        try:
+            return authenticate(request, username=username, password=password)
+        finally:
+            close_old_connections()
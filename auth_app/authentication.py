@@ -0,0 +1,101 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+
+class TokenCache:
+    """Bounded, thread-safe LRU of token key -> (user, token) with a per-entry TTL.
+
+    The cache is per process: invalidation only reaches the process that made
+    the change, so the TTL bounds how long other workers may serve stale data.
+    """
+    def __init__(self, maxsize, timeout):
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._keys_by_user = {}
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        user, _ = value
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + self.timeout, value)
+            self._keys_by_user.setdefault(user.pk, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def invalidate_user(self, user_id):
+        with self._lock:
+            for key in list(self._keys_by_user.get(user_id, ())):
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        user, _ = entry[1]
+        keys = self._keys_by_user.get(user.pk)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[user.pk]
+
+
+token_cache = TokenCache(
+    maxsize=getattr(settings, "AUTH_TOKEN_CACHE_SIZE", 10000),
+    timeout=getattr(settings, "AUTH_TOKEN_CACHE_TIMEOUT", 60),
+)
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """TokenAuthentication resolving token, user and profile in one query, cached in-process.
+
+    The profile is loaded with the user, so role permissions checking
+    request.user.profile need no query of their own. Entries are dropped when
+    the token is deleted or the user or profile changes (see auth_app.signals).
+    """
+    def authenticate_credentials(self, key):
+        cached = token_cache.get(key)
+        if cached is None:
+            cached = self._load(key)
+            token_cache.set(key, cached)
+        # Every request gets its own instances, so no request mutates another's user.
+        return copy.deepcopy(cached)
+
+    def _load(self, key):
+        try:
+            token = Token.objects.select_related("user", "user__profile").get(key=key)
+        except Token.DoesNotExist:
+            raise exceptions.AuthenticationFailed("Invalid token.")
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed("User inactive or deleted.")
+        return token.user, token
@@ -0,0 +1,42 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+
+
+class HashingPoolSaturated(Exception):
+    """Raised instead of queueing when every hashing slot is taken."""
+
+
+class HashingPool:
+    """Bounded thread pool for password hashing off the event loop.
+
+    PBKDF2 runs in OpenSSL without the GIL, so the workers hash in parallel.
+    At most max_pending calls may run or wait at once; further calls fail
+    fast with HashingPoolSaturated, so a login spike cannot build a queue
+    that outlives the clients waiting on it.
+    """
+    def __init__(self, workers, max_pending):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hashing")
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+    async def run(self, func, *args, **kwargs):
+        if not self._slots.acquire(blocking=False):
+            raise HashingPoolSaturated()
+        try:
+            future = self._executor.submit(func, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        # Released when the worker finishes, not when the caller stops waiting: a
+        # cancelled request must not free a slot whose hash is still running.
+        future.add_done_callback(lambda _: self._slots.release())
+        return await asyncio.wrap_future(future)
+
+
+hashing_pool = HashingPool(
+    workers=getattr(settings, "PASSWORD_HASHING_WORKERS", 4),
+    max_pending=getattr(settings, "PASSWORD_HASHING_MAX_PENDING", 64),
+)
+
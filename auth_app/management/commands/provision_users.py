@@ -0,0 +1,111 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from auth_app.provisioning import (
+    Checkpoint,
+    clean_row,
+    create_accounts,
+    find_duplicates,
+    hash_password,
+    init_worker,
+    read_rows,
+)
+
+
+class Command(BaseCommand):
+    """Creates users with profile and token in bulk from a CSV or NDJSON file."""
+    help = (
+        "Provisions accounts from a CSV (header: username,email,password,type) or NDJSON file. "
+        "Passwords are hashed across a process pool and each chunk is inserted in one transaction. "
+        "Progress is checkpointed, so rerunning the command resumes after the last committed chunk."
+    )
+    max_reported_rows = 100
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--format", choices=["csv", "ndjson"], default=None)
+        parser.add_argument("--chunk-size", type=int, default=500)
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+        parser.add_argument("--checkpoint", default=None, help="Defaults to <path>.checkpoint.")
+        parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint.")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if not os.path.exists(path):
+            raise CommandError(f"{path} does not exist.")
+        fmt = options["format"] or ("csv" if path.lower().endswith(".csv") else "ndjson")
+
+        checkpoint = Checkpoint(options["checkpoint"] or f"{path}.checkpoint", path)
+        if options["restart"]:
+            checkpoint.clear()
+        try:
+            start_after = checkpoint.load()
+        except ValueError as exc:
+            raise CommandError(f"{exc} Pass --restart or another --checkpoint.")
+        if start_after:
+            self.stdout.write(f"Resuming after row {start_after}.")
+
+        self.workers = max(1, options["workers"])
+        self.created = 0
+        self.skipped = 0
+        self.reported = 0
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker) as pool:
+            chunk = []
+            try:
+                for row_number, data, error in read_rows(path, fmt):
+                    if row_number <= start_after:
+                        continue
+                    chunk.append((row_number, data, error))
+                    if len(chunk) >= options["chunk_size"]:
+                        self._process_chunk(chunk, pool, checkpoint)
+                        chunk = []
+                if chunk:
+                    self._process_chunk(chunk, pool, checkpoint)
+            except ValueError as exc:
+                raise CommandError(str(exc))
+
+        self.stdout.write(self.style.SUCCESS(f"Created {self.created} users, skipped {self.skipped} rows."))
+
+    def _process_chunk(self, chunk, pool, checkpoint):
+        accounts = []
+        for row_number, data, error in chunk:
+            account = None
+            if error is None:
+                account, error = clean_row(data)
+            if error is not None:
+                self._skip(row_number, error)
+                continue
+            account["row"] = row_number
+            accounts.append(account)
+
+        accounts, duplicates = find_duplicates(accounts)
+        for account, reason in duplicates:
+            self._skip(account["row"], f"{reason} ({account['username']}, {account['email']})")
+
+        if accounts:
+            passwords = [account["password"] for account in accounts]
+            chunksize = max(1, len(passwords) // (self.workers * 4))
+            password_hashes = list(pool.map(hash_password, passwords, chunksize=chunksize))
+            try:
+                create_accounts(accounts, password_hashes)
+            except IntegrityError as exc:
+                raise CommandError(
+                    f"Rows {chunk[0][0]}-{chunk[-1][0]} clashed with accounts created meanwhile ({exc}). "
+                    "Rerun the command to resume from this chunk."
+                )
+            self.created += len(accounts)
+
+        checkpoint.save(chunk[-1][0])
+        self.stdout.write(f"Rows up to {chunk[-1][0]}: {self.created} created, {self.skipped} skipped.")
+
+    def _skip(self, row_number, reason):
+        self.skipped += 1
+        if self.reported < self.max_reported_rows:
+            self.reported += 1
+            self.stderr.write(f"Row {row_number}: {reason}")
+        elif self.reported == self.max_reported_rows:
+            self.reported += 1
+            self.stderr.write("Further skipped rows are only counted.")
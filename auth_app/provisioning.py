@@ -0,0 +1,145 @@
+import csv
+import json
+import os
+
+import django
+from django.apps import apps
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Q
+from rest_framework.authtoken.models import Token
+
+from profiles_app.models import UserProfile, build_search_name
+
+
+FIELDS = ["username", "email", "password", "type"]
+PROFILE_TYPES = ["customer", "business"]
+
+
+def init_worker():
+    """Sets Django up in spawned hashing processes; forked ones inherit it."""
+    if not apps.ready:
+        django.setup()
+
+
+def hash_password(password):
+    return make_password(password)
+
+
+def read_rows(path, fmt):
+    """Yields (row_number, data, error) from a CSV file with a header row or from NDJSON."""
+    with open(path, newline="", encoding="utf-8") as stream:
+        if fmt == "csv":
+            yield from _read_csv(stream)
+        else:
+            yield from _read_ndjson(stream)
+
+
+def _read_csv(stream):
+    reader = csv.DictReader(stream)
+    missing = set(FIELDS) - set(reader.fieldnames or [])
+    if missing:
+        raise ValueError(f"CSV header is missing: {', '.join(sorted(missing))}")
+    for row_number, row in enumerate(reader, start=1):
+        yield row_number, row, None
+
+
+def _read_ndjson(stream):
+    row_number = 0
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        row_number += 1
+        try:
+            data = json.loads(line)
+        except ValueError as exc:
+            yield row_number, None, f"malformed JSON ({exc})"
+            continue
+        if not isinstance(data, dict):
+            yield row_number, None, "expected a JSON object"
+            continue
+        yield row_number, data, None
+
+
+def clean_row(data):
+    """Returns (account, error) for one input row."""
+    account = {field: str(data.get(field) or "").strip() for field in FIELDS}
+    account["password"] = str(data.get("password") or "")
+    missing = [field for field in FIELDS if not account[field]]
+    if missing:
+        return None, f"missing {', '.join(missing)}"
+    if account["type"] not in PROFILE_TYPES:
+        return None, f"invalid type '{account['type']}'"
+    account["username"] = User.normalize_username(account["username"])
+    account["email"] = User.objects.normalize_email(account["email"])
+    return account, None
+
+
+def find_duplicates(accounts):
+    """Splits accounts into new ones and (account, reason) pairs clashing with the database or each other."""
+    usernames = [account["username"] for account in accounts]
+    emails = [account["email"] for account in accounts]
+    existing = User.objects.filter(Q(username__in=usernames) | Q(email__in=emails)).values_list("username", "email")
+    taken_usernames, taken_emails = set(), set()
+    for username, email in existing:
+        taken_usernames.add(username)
+        taken_emails.add(email)
+
+    fresh, duplicates = [], []
+    for account in accounts:
+        if account["username"] in taken_usernames:
+            duplicates.append((account, "username already exists"))
+        elif account["email"] in taken_emails:
+            duplicates.append((account, "email already in use"))
+        else:
+            fresh.append(account)
+        taken_usernames.add(account["username"])
+        taken_emails.add(account["email"])
+    return fresh, duplicates
+
+
+@transaction.atomic
+def create_accounts(accounts, password_hashes):
+    """Inserts users, profiles and tokens of one chunk with three bulk INSERTs."""
+    users = User.objects.bulk_create(
+        [
+            User(username=account["username"], email=account["email"], password=password_hash)
+            for account, password_hash in zip(accounts, password_hashes)
+        ]
+    )
+    UserProfile.objects.bulk_create(
+        [
+            UserProfile(user=user, type=account["type"], search_name=build_search_name(user))
+            for user, account in zip(users, accounts)
+        ]
+    )
+    Token.objects.bulk_create([Token(user=user, key=Token.generate_key()) for user in users])
+    return users
+
+
+class Checkpoint:
+    """Last input row whose chunk was committed, stored next to the input by default."""
+    def __init__(self, path, source):
+        self.path = path
+        self.source = os.path.abspath(source)
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return 0
+        with open(self.path, encoding="utf-8") as stream:
+            data = json.load(stream)
+        if data.get("source") != self.source:
+            raise ValueError(f"Checkpoint {self.path} belongs to {data.get('source')}.")
+        return data["row"]
+
+    def save(self, row_number):
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as stream:
+            json.dump({"source": self.source, "row": row_number}, stream)
+        os.replace(temporary, self.path)
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,24 @@
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from auth_app.authentication import token_cache
+from profiles_app.models import UserProfile
+
+
+@receiver(post_delete, sender=Token)
+def drop_deleted_token(sender, instance, **kwargs):
+    """Drops a deleted token now and once more after commit, in case it was re-cached meanwhile."""
+    token_cache.invalidate(instance.key)
+    transaction.on_commit(lambda: token_cache.invalidate(instance.key))
+
+
+@receiver([post_save, post_delete], sender=User)
+@receiver([post_save, post_delete], sender=UserProfile)
+def drop_changed_user_tokens(sender, instance, **kwargs):
+    """Drops the cached identities of a user whose account or profile changed."""
+    user_id = instance.pk if sender is User else instance.user_id
+    token_cache.invalidate_user(user_id)
+    transaction.on_commit(lambda: token_cache.invalidate_user(user_id))
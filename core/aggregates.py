@@ -0,0 +1,27 @@
+from django.db import transaction
+
+
+def reconcile(model, fields, sources, key="business_user"):
+    """Recomputes the counter `fields` of every `model` row and returns how many were wrong.
+
+    Each source pairs a values() queryset grouped by `key` with a function that
+    maps one of its rows to the amounts it adds to the fields. Rows whose stored
+    counters differ are updated and missing rows are created, under a lock.
+    """
+    actual = {}
+    for rows, mapping in sources:
+        for row in rows:
+            counts = actual.setdefault(row[key], dict.fromkeys(fields, 0))
+            for field, amount in mapping(row).items():
+                counts[field] += amount
+
+    key_field = f"{key}_id"
+    repaired = 0
+    with transaction.atomic():
+        for stored in model.objects.select_for_update():
+            counts = actual.pop(getattr(stored, key_field), dict.fromkeys(fields, 0))
+            if any(getattr(stored, field) != counts[field] for field in fields):
+                model.objects.filter(pk=stored.pk).update(**counts)
+                repaired += 1
+        model.objects.bulk_create([model(**{key_field: key_value}, **counts) for key_value, counts in actual.items()])
+    return repaired + len(actual)
@@ -5,6 +5,11 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
+
+Serve the project through this application (e.g. ``uvicorn core.asgi:application``)
+to use the streaming order feed at /api/orders/events/: open feeds wait on the
+event loop instead of holding a worker thread each. Login and registration are
+async views too; their password hashing runs on auth_app.hashing's bounded pool.
 """
 
 import os
@@ -0,0 +1,29 @@
+from django.conf import settings
+from rest_framework.response import Response
+
+
+class ValuesListMixin:
+    """Serves list() through ``values_serializer_class`` when FAST_LIST_SERIALIZATION is on.
+
+    Turning the setting off falls back to the regular serializer, which renders
+    the same output, so both paths can be compared.
+    """
+    values_serializer_class = None
+
+    def get_values_serializer(self):
+        """Returns the fast-path serializer, or None when FAST_LIST_SERIALIZATION is off."""
+        if not getattr(settings, "FAST_LIST_SERIALIZATION", True):
+            return None
+        return self.values_serializer_class(context=self.get_serializer_context())
+
+    def list(self, request, *args, **kwargs):
+        serializer = self.get_values_serializer()
+        if serializer is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = serializer.get_queryset(self.filter_queryset(self.get_queryset()))
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serializer.serialize(page))
+        return Response(serializer.serialize(queryset))
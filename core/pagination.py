@@ -0,0 +1,159 @@
+import base64
+import binascii
+import datetime
+import json
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """Cursor pagination over a composite sort key ending in a unique field.
+
+    Each page continues strictly after the key of the previous page's last row,
+    so neither COUNT(*) nor an OFFSET scan is needed and every page costs the
+    same regardless of depth. Subclasses declare the keys they accept in
+    `orderings`, keyed by the ?ordering= value; the first entry is the default
+    unless `default_ordering` says otherwise.
+    """
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    page_size = 20
+    max_page_size = 100
+    invalid_cursor_message = "Invalid cursor"
+    orderings = {}
+    default_ordering = None
+
+    def get_ordering(self, request, queryset, view):
+        """Returns the key fields for ?ordering=, e.g. ("-updated_at", "-id")."""
+        requested = request.query_params.get("ordering")
+        if requested in self.orderings:
+            return self.orderings[requested]
+        return self.default_ordering or next(iter(self.orderings.values()))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.paginate_union([queryset], request, view)
+
+    def paginate_union(self, querysets, request, view=None):
+        """Paginates the UNION ALL of index-friendly branches.
+
+        The cursor condition is pushed into every branch, since a combined
+        queryset cannot be filtered, so each branch seeks its own index before
+        the union is ordered and cut to one page.
+        """
+        self.request = request
+        self.ordering = tuple(self.get_ordering(request, querysets[0], view))
+        self.page_size = self.get_page_size(request)
+
+        position = self.decode_cursor(request)
+        if position is not None:
+            querysets = [queryset.filter(self._after(position, queryset.model)) for queryset in querysets]
+        queryset = union_all(querysets).order_by(*self.ordering)
+
+        rows = list(queryset[: self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        position = [self._key_value(last, field.lstrip("-")) for field in self.ordering]
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(position))
+
+    def encode_cursor(self, position):
+        payload = json.dumps({"o": self.ordering, "k": position}, default=_encode_value)
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            ordering, position = tuple(payload["o"]), payload["k"]
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if ordering != self.ordering or len(position) != len(ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def _after(self, position, model):
+        """Builds (k1 > v1) OR (k1 = v1 AND k2 > v2) ... honouring each direction.
+
+        NULL keys compare the way SQLite sorts them, below every value, so a
+        cursor holding a NULL never reaches a plain comparison.
+        """
+        condition = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, position):
+            name = field.lstrip("-")
+            descending = field.startswith("-")
+            if value is None:
+                if not descending:
+                    condition |= equal & Q(**{f"{name}__isnull": False})
+                equal &= Q(**{f"{name}__isnull": True})
+                continue
+            later = Q(**{f"{name}__{'lt' if descending else 'gt'}": value})
+            if descending and model._meta.get_field(name).null:
+                later |= Q(**{f"{name}__isnull": True})
+            condition |= equal & later
+            equal &= Q(**{name: value})
+        return condition
+
+    def _key_value(self, row, name):
+        if isinstance(row, dict):
+            return row[name]
+        return getattr(row, name)
+
+
+class OptionalKeysetPagination(KeysetPagination):
+    """KeysetPagination applied only when ?cursor= is present (empty for the first page).
+
+    Requests without it stay unpaginated, as the list endpoints always were.
+    """
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+
+def union_all(querysets):
+    """Combines querysets with UNION ALL; a single queryset is returned as is."""
+    first, *rest = querysets
+    if not rest:
+        return first
+    return first.union(*rest, all=True)
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    raise TypeError(f"Cannot encode {type(value).__name__} in a cursor.")
@@ -0,0 +1,16 @@
+from rest_framework.exceptions import ValidationError
+
+
+def parse_id_list(raw_ids, param, max_count):
+    """Parses a comma-separated ?param= of integer ids, deduplicated in request order.
+
+    Raises ValidationError keyed by param for malformed input or more than
+    max_count distinct ids.
+    """
+    parts = [part.strip() for part in raw_ids.split(",") if part.strip()]
+    if not parts or not all(part.isdigit() for part in parts):
+        raise ValidationError({param: "Expected a comma-separated list of integer ids."})
+    ids = list(dict.fromkeys(int(part) for part in parts))
+    if len(ids) > max_count:
+        raise ValidationError({param: f"At most {max_count} ids can be requested at once."})
+    return ids
@@ -128,9 +128,36 @@ STATIC_URL = 'static/'
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
+        "auth_app.authentication.CachedTokenAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
-}
\ No newline at end of file
+}
+
+# Point this at a shared backend (Redis/Memcached) in production so every
+# worker serves the same cached offer lists.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+OFFER_LIST_CACHE_TIMEOUT = 300
+
+# Build read-only list responses from .values() rows (see core.serializers).
+FAST_LIST_SERIALIZATION = True
+
+# Completed/cancelled orders untouched for this many days are moved to the
+# archive table by `manage.py archive_orders`.
+ORDER_ARCHIVE_AFTER_DAYS = 90
+
+# In-process token -> user/profile cache of CachedTokenAuthentication. Changes
+# are invalidated locally; other processes see them after the timeout (seconds).
+AUTH_TOKEN_CACHE_SIZE = 10000
+AUTH_TOKEN_CACHE_TIMEOUT = 60
+
+# Bounded pool hashing passwords for the async login/registration views.
+# Requests beyond PASSWORD_HASHING_MAX_PENDING get an immediate 503.
+PASSWORD_HASHING_WORKERS = 4
+PASSWORD_HASHING_MAX_PENDING = 64
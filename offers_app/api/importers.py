@@ -0,0 +1,156 @@
+import codecs
+import json
+
+from django.db import DatabaseError, transaction
+
+from offers_app import cache as offer_list_cache
+from offers_app.features import sync_feature_tags
+from offers_app.models import Offer, OfferDetail
+from .serializers import OfferWriteSerializer, get_min_values
+
+
+NDJSON_CONTENT_TYPES = ["application/x-ndjson", "application/jsonl", "application/json-seq"]
+READ_SIZE = 64 * 1024
+
+
+def iter_rows(stream, content_type):
+    """Yields (row_number, data, error) tuples from an NDJSON or JSON array stream."""
+    if content_type in NDJSON_CONTENT_TYPES:
+        return _iter_ndjson(stream)
+    return _iter_json_array(stream)
+
+
+def _iter_ndjson(stream):
+    row_number = 0
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        row_number += 1
+        try:
+            yield row_number, json.loads(line), None
+        except ValueError as exc:
+            yield row_number, None, {"detail": f"Malformed JSON: {exc}"}
+
+
+def _iter_json_array(stream):
+    """Decodes one array element at a time, keeping only the current one in memory."""
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    eof = False
+    started = False
+    row_number = 0
+
+    while True:
+        buffer = buffer.lstrip()
+        if started and buffer.startswith(","):
+            buffer = buffer[1:]
+            continue
+        if started and buffer.startswith("]"):
+            return
+        if buffer and not started:
+            if not buffer.startswith("["):
+                yield 1, None, {"detail": "Expected a JSON array of offers."}
+                return
+            buffer = buffer[1:]
+            started = True
+            continue
+
+        if buffer:
+            try:
+                data, end = decoder.raw_decode(buffer)
+            except ValueError as exc:
+                if eof:
+                    yield row_number + 1, None, {"detail": f"Malformed JSON: {exc}"}
+                    return
+            else:
+                row_number += 1
+                buffer = buffer[end:]
+                yield row_number, data, None
+                continue
+
+        if eof:
+            if not started:
+                yield 1, None, {"detail": "Expected a JSON array of offers."}
+            else:
+                yield row_number + 1, None, {"detail": "Unterminated JSON array."}
+            return
+
+        chunk = stream.read(READ_SIZE)
+        eof = not chunk
+        buffer += text.decode(chunk, final=eof)
+
+
+class OfferBulkImporter:
+    """Validates offers with OfferWriteSerializer and inserts them in batches.
+
+    Every batch is written with bulk_create inside its own transaction, so a
+    failing row never aborts the import and memory is bounded by batch_size.
+    """
+    batch_size = 100
+    max_reported_errors = 100
+
+    def __init__(self, request):
+        self.request = request
+        self.created = 0
+        self.failed = 0
+        self.errors = []
+
+    def run(self, rows):
+        batch = []
+        for row_number, data, error in rows:
+            if error is None:
+                data, error = self._validate(data)
+            if error is not None:
+                self._add_error(row_number, error)
+                continue
+            batch.append((row_number, data))
+            if len(batch) >= self.batch_size:
+                self._write(batch)
+                batch = []
+        if batch:
+            self._write(batch)
+        return self.get_summary()
+
+    def get_summary(self):
+        return {"created": self.created, "failed": self.failed, "errors": self.errors}
+
+    def _validate(self, data):
+        if not isinstance(data, dict):
+            return None, {"detail": "Each offer must be a JSON object."}
+        serializer = OfferWriteSerializer(data=data, context={"request": self.request})
+        if not serializer.is_valid():
+            return None, serializer.errors
+        return serializer.validated_data, None
+
+    def _write(self, batch):
+        user = self.request.user
+        try:
+            with transaction.atomic():
+                offers = Offer.objects.bulk_create(
+                    [self._build_offer(user, data) for _, data in batch]
+                )
+                details = OfferDetail.objects.bulk_create(
+                    [
+                        OfferDetail(offer=offer, **detail_data)
+                        for offer, (_, data) in zip(offers, batch)
+                        for detail_data in data["details"]
+                    ]
+                )
+                sync_feature_tags(details)
+                transaction.on_commit(lambda: offer_list_cache.invalidate_creator(user.id))
+        except DatabaseError as exc:
+            for row_number, _ in batch:
+                self._add_error(row_number, {"detail": f"Database error: {exc}"})
+            return
+        self.created += len(batch)
+
+    def _build_offer(self, user, data):
+        fields = {key: value for key, value in data.items() if key != "details"}
+        return Offer(user=user, **get_min_values(data["details"]), **fields)
+
+    def _add_error(self, row_number, error):
+        self.failed += 1
+        if len(self.errors) < self.max_reported_errors:
+            self.errors.append({"row": row_number, "errors": error})
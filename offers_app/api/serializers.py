@@ -1,6 +1,18 @@
+from django.db import transaction
 from django.urls import reverse
 from rest_framework import serializers
+from core.serializers import ValuesSerializer, reverse_template
+from offers_app.features import sync_feature_tags
 from offers_app.models import Offer, OfferDetail
+from reviews_app.ratings import get_average
+
+
+def get_min_values(details_data):
+    """Returns the denormalized min values of an offer from its detail payloads."""
+    return {
+        "min_price": min(d["price"] for d in details_data),
+        "min_delivery_time": min(d["delivery_time_in_days"] for d in details_data),
+    }
 
 
 class OfferDetailWriteSerializer(serializers.ModelSerializer):
@@ -31,7 +43,49 @@ class OfferDetailLinkSerializer(serializers.ModelSerializer):
         return reverse("offerdetail-detail", kwargs={"pk": obj.id})
 
 
-class OfferListSerializer(serializers.ModelSerializer):
+class OfferDetailExpandedSerializer(OfferDetailLinkSerializer):
+    """Serializer returning the full OfferDetail body together with its URL."""
+    class Meta:
+        model = OfferDetail
+        fields = [
+            "id",
+            "url",
+            "title",
+            "revisions",
+            "delivery_time_in_days",
+            "price",
+            "features",
+            "offer_type",
+        ]
+
+
+class OfferDetailLinkValuesSerializer(ValuesSerializer):
+    """Fast path of OfferDetailLinkSerializer built from .values() rows."""
+    serializer_class = OfferDetailLinkSerializer
+
+    def __init__(self, context=None):
+        self.detail_url = reverse_template("offerdetail-detail")
+        super().__init__(context)
+
+    def get_url(self, row):
+        return self.detail_url(row["id"])
+
+
+class OfferDetailExpandedValuesSerializer(OfferDetailLinkValuesSerializer):
+    """Fast path of OfferDetailExpandedSerializer built from .values() rows."""
+    serializer_class = OfferDetailExpandedSerializer
+
+
+class ExpandableDetailsMixin:
+    """Inlines full detail bodies when the context asks for expand=details."""
+    def get_fields(self):
+        fields = super().get_fields()
+        if self.context.get("expand_details"):
+            fields["details"] = OfferDetailExpandedSerializer(many=True, read_only=True)
+        return fields
+
+
+class OfferListSerializer(ExpandableDetailsMixin, serializers.ModelSerializer):
     """Serializer for offer list endpoint including user_details and min values."""
     min_price = serializers.FloatField(read_only=True)
     min_delivery_time = serializers.IntegerField(read_only=True)
@@ -55,14 +109,56 @@ class OfferListSerializer(serializers.ModelSerializer):
         ]
 
     def get_user_details(self, obj):
+        rating = getattr(obj.user, "rating_summary", None)
         return {
             "first_name": obj.user.first_name or "",
             "last_name": obj.user.last_name or "",
             "username": obj.user.username,
+            "review_count": rating.review_count if rating else 0,
+            "average_rating": get_average(rating.review_count, rating.rating_sum) if rating else None,
+        }
+
+
+class OfferListValuesSerializer(ValuesSerializer):
+    """Fast path of OfferListSerializer built from .values() rows."""
+    serializer_class = OfferListSerializer
+    extra_lookups = [
+        "user__first_name",
+        "user__last_name",
+        "user__username",
+        "user__rating_summary__review_count",
+        "user__rating_summary__rating_sum",
+    ]
+
+    def prepare(self, rows):
+        if self.context.get("expand_details"):
+            detail_serializer = OfferDetailExpandedValuesSerializer(self.context)
+        else:
+            detail_serializer = OfferDetailLinkValuesSerializer(self.context)
+
+        details = OfferDetail.objects.filter(offer__in=[row["id"] for row in rows]).order_by("id")
+        self.details = {}
+        for detail in details.values(*detail_serializer.get_lookups(), "offer"):
+            self.details.setdefault(detail["offer"], []).append(
+                detail_serializer.to_representation(detail)
+            )
+
+    def get_details(self, row):
+        return self.details.get(row["id"], [])
+
+    def get_user_details(self, row):
+        return {
+            "first_name": row["user__first_name"] or "",
+            "last_name": row["user__last_name"] or "",
+            "username": row["user__username"],
+            "review_count": row["user__rating_summary__review_count"] or 0,
+            "average_rating": get_average(
+                row["user__rating_summary__review_count"], row["user__rating_summary__rating_sum"]
+            ),
         }
 
 
-class OfferRetrieveSerializer(serializers.ModelSerializer):
+class OfferRetrieveSerializer(ExpandableDetailsMixin, serializers.ModelSerializer):
     """Serializer for offer detail endpoint with links to offer details."""
     min_price = serializers.FloatField(read_only=True)
     min_delivery_time = serializers.IntegerField(read_only=True)
@@ -101,25 +197,31 @@ class OfferWriteSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Each detail must have a unique offer_type.")
         return value
 
+    @transaction.atomic
     def create(self, validated_data):
         details_data = validated_data.pop("details")
-        offer = self._create_offer(validated_data)
+        offer = self._create_offer(validated_data, details_data)
         self._create_details(offer, details_data)
         return offer
 
-    def _create_offer(self, validated_data):
+    def _create_offer(self, validated_data, details_data):
         request = self.context["request"]
-        return Offer.objects.create(user=request.user, **validated_data)
+        return Offer.objects.create(
+            user=request.user,
+            **get_min_values(details_data),
+            **validated_data,
+        )
 
     def _create_details(self, offer, details_data):
-        for detail_data in details_data:
-            OfferDetail.objects.create(offer=offer, **detail_data)
+        details = [OfferDetail.objects.create(offer=offer, **detail_data) for detail_data in details_data]
+        sync_feature_tags(details)
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         details_data = validated_data.pop("details", None)
-        self._update_offer_fields(instance, validated_data)
         if details_data is not None:
             self._update_offer_details(instance, details_data)
+        self._update_offer_fields(instance, validated_data)
         return instance
 
     def _update_offer_fields(self, instance, data):
@@ -128,24 +230,44 @@ class OfferWriteSerializer(serializers.ModelSerializer):
         instance.save()
 
     def _update_offer_details(self, offer, details_data):
+        """Applies all detail changes with one SELECT and one bulk UPDATE."""
+        details = {detail.offer_type: detail for detail in offer.details.all()}
+        changed_details = []
+        changed_fields = set()
         for detail in details_data:
             offer_type = detail.get("offer_type")
             if not offer_type:
                 raise serializers.ValidationError({"offer_type": "offer_type is required."})
 
-            offer_detail = self._get_offer_detail(offer, offer_type)
-            self._apply_detail_fields(offer_detail, detail)
-            offer_detail.save()
+            offer_detail = self._get_offer_detail(details, offer_type)
+            fields = self._apply_detail_fields(offer_detail, detail)
+            if fields:
+                changed_details.append(offer_detail)
+                changed_fields.update(fields)
 
-    def _get_offer_detail(self, offer, offer_type):
+        if changed_details:
+            OfferDetail.objects.bulk_update(changed_details, sorted(changed_fields))
+        if "features" in changed_fields:
+            sync_feature_tags(changed_details)
+        self._apply_min_values(offer, details.values())
+
+    def _get_offer_detail(self, details, offer_type):
         try:
-            return OfferDetail.objects.get(offer=offer, offer_type=offer_type)
-        except OfferDetail.DoesNotExist:
+            return details[offer_type]
+        except KeyError:
             raise serializers.ValidationError(
                 {"details": f"Detail with offer_type '{offer_type}' not found."}
             )
 
     def _apply_detail_fields(self, offer_detail, detail):
+        changed = []
         for field in ["title", "revisions", "delivery_time_in_days", "price", "features"]:
-            if field in detail:
+            if field in detail and getattr(offer_detail, field) != detail[field]:
                 setattr(offer_detail, field, detail[field])
+                changed.append(field)
+        return changed
+
+    def _apply_min_values(self, offer, details):
+        details = list(details)
+        offer.min_price = min(detail.price for detail in details)
+        offer.min_delivery_time = min(detail.delivery_time_in_days for detail in details)
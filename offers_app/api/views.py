@@ -1,26 +1,100 @@
-from django.db.models import Min, Q
-from rest_framework import viewsets
+from django.db.models import Prefetch
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.response import Response
 
+from core.mixins import ValuesListMixin
+from core.pagination import KeysetPagination
+from core.params import parse_id_list
+from offers_app import cache as offer_list_cache
+from offers_app.features import offer_ids_with_feature
 from offers_app.models import Offer, OfferDetail
+from offers_app.search import search_offers
+from .importers import OfferBulkImporter, iter_rows
 from .permissions import IsBusinessUser, IsOfferOwner
 from .serializers import (
     OfferListSerializer,
+    OfferListValuesSerializer,
     OfferRetrieveSerializer,
     OfferWriteSerializer,
     OfferDetailWriteSerializer,
 )
 
 
+class OfferCursorPagination(KeysetPagination):
+    """Keyset pagination keyed by the requested ordering with id as tiebreaker."""
+    orderings = {
+        "-updated_at": ("-updated_at", "-id"),
+        "updated_at": ("updated_at", "id"),
+        "min_price": ("min_price", "id"),
+        "-min_price": ("-min_price", "-id"),
+    }
+
+    def paginate_queryset(self, queryset, request, view=None):
+        ordering = self.get_ordering(request, queryset, view)
+        if any(field.lstrip("-") == "min_price" for field in ordering):
+            queryset = queryset.filter(min_price__isnull=False)
+        return super().paginate_queryset(queryset, request, view)
+
+
 class OfferPagination(PageNumberPagination):
-    """PageNumberPagination with adjustable page_size."""
+    """PageNumberPagination with adjustable page_size; ?cursor= opts into keyset mode."""
     page_size_query_param = "page_size"
+    cursor_class = OfferCursorPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_paginator = None
+        if self.cursor_class.cursor_query_param in request.query_params:
+            self.cursor_paginator = self.cursor_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
 
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
 
-class OfferViewSet(viewsets.ModelViewSet):
+
+class OfferViewSet(ValuesListMixin, viewsets.ModelViewSet):
     """Offers CRUD with public list and restricted create/update/delete."""
     pagination_class = OfferPagination
+    values_serializer_class = OfferListValuesSerializer
+
+    def list(self, request, *args, **kwargs):
+        """Serves anonymous list requests from the shared response cache."""
+        if request.user.is_authenticated:
+            return super().list(request, *args, **kwargs)
+
+        key = offer_list_cache.build_key(request)
+        data = offer_list_cache.lookup(key)
+        if data is not None:
+            return Response(data)
+
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == 200:
+            offer_list_cache.store(key, response.data)
+        return response
+
+    @action(detail=False, methods=["post"], url_path="bulk-import")
+    def bulk_import(self, request):
+        """Imports an NDJSON stream or JSON array of offers, reporting per-row errors."""
+        if request.stream is None:
+            return Response({"detail": "Empty payload."}, status=status.HTTP_400_BAD_REQUEST)
+
+        importer = OfferBulkImporter(request)
+        summary = importer.run(iter_rows(request.stream, request.content_type))
+        return Response(summary, status=status.HTTP_200_OK)
+
+    def update(self, request, *args, **kwargs):
+        """Keeps the prefetched details, which OfferWriteSerializer.update updates in place."""
+        partial = kwargs.pop("partial", False)
+        instance = self.get_object()
+        serializer = self.get_serializer(instance, data=request.data, partial=partial)
+        serializer.is_valid(raise_exception=True)
+        self.perform_update(serializer)
+        return Response(serializer.data)
 
     def get_queryset(self):
         qs = self._base_queryset()
@@ -29,14 +103,8 @@ class OfferViewSet(viewsets.ModelViewSet):
         return self._apply_ordering(qs)
 
     def _base_queryset(self):
-        return (
-            Offer.objects.select_related("user")
-            .prefetch_related("details")
-            .annotate(
-                min_price=Min("details__price"),
-                min_delivery_time=Min("details__delivery_time_in_days"),
-            )
-        )
+        details = Prefetch("details", queryset=OfferDetail.objects.order_by("id"))
+        return Offer.objects.select_related("user", "user__rating_summary").prefetch_related(details)
 
     def _apply_filters(self, qs):
         creator_id = self.request.query_params.get("creator_id")
@@ -51,13 +119,17 @@ class OfferViewSet(viewsets.ModelViewSet):
         if max_delivery_time:
             qs = qs.filter(min_delivery_time__lte=max_delivery_time)
 
+        feature = self.request.query_params.get("feature")
+        if feature:
+            qs = qs.filter(id__in=offer_ids_with_feature(feature))
+
         return qs
 
     def _apply_search(self, qs):
         search = self.request.query_params.get("search")
         if not search:
             return qs
-        return qs.filter(Q(title__icontains=search) | Q(description__icontains=search))
+        return search_offers(qs, search)
 
     def _apply_ordering(self, qs):
         ordering = self.request.query_params.get("ordering")
@@ -71,12 +143,18 @@ class OfferViewSet(viewsets.ModelViewSet):
             return [AllowAny()]
         if self.action == "retrieve":
             return [IsAuthenticated()]
-        if self.action == "create":
+        if self.action in ["create", "bulk_import"]:
             return [IsAuthenticated(), IsBusinessUser()]
         if self.action in ["partial_update", "destroy"]:
             return [IsAuthenticated(), IsOfferOwner()]
         return [IsAuthenticated()]
 
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        expand = self.request.query_params.get("expand", "") if self.request else ""
+        context["expand_details"] = "details" in expand.split(",")
+        return context
+
     def get_serializer_class(self):
         if self.action == "list":
             return OfferListSerializer
@@ -85,8 +163,41 @@ class OfferViewSet(viewsets.ModelViewSet):
         return OfferWriteSerializer
 
 
+class OfferDetailPagination(PageNumberPagination):
+    """Pages the unfiltered offer detail list."""
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+
+
 class OfferDetailViewSet(viewsets.ReadOnlyModelViewSet):
-    """Read-only access to offer details for authenticated users."""
-    queryset = OfferDetail.objects.all()
+    """Read-only access to offer details with batch (?ids=) and per-offer (?offer_id=) lookup."""
+    queryset = OfferDetail.objects.order_by("id")
     serializer_class = OfferDetailWriteSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = OfferDetailPagination
+    max_batch_size = 100
+
+    def list(self, request, *args, **kwargs):
+        if "ids" in request.query_params:
+            return self._list_by_ids(request.query_params["ids"])
+        if "offer_id" in request.query_params:
+            return self._list_by_offer(request.query_params["offer_id"])
+        return super().list(request, *args, **kwargs)
+
+    def _list_by_ids(self, raw_ids):
+        ids = parse_id_list(raw_ids, "ids", self.max_batch_size)
+        found = self.get_queryset().in_bulk(ids)
+        details = [found[detail_id] for detail_id in ids if detail_id in found]
+        return Response(
+            {
+                "results": self.get_serializer(details, many=True).data,
+                "missing": [detail_id for detail_id in ids if detail_id not in found],
+            }
+        )
+
+    def _list_by_offer(self, offer_id):
+        if not offer_id.isdigit():
+            return Response({"offer_id": "Expected an integer id."}, status=status.HTTP_400_BAD_REQUEST)
+        details = self.get_queryset().filter(offer_id=offer_id)
+        return Response(self.get_serializer(details, many=True).data)
@@ -1,5 +1,19 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def restore_search_triggers(sender, using, **kwargs):
+    from django.db import connections
+
+    from . import search
+
+    search.restore_triggers(connections[using])
 
 
 class OffersAppConfig(AppConfig):
     name = 'offers_app'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+
+        post_migrate.connect(restore_search_triggers, sender=self)
@@ -0,0 +1,103 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+LIST_PARAMS = [
+    "creator_id",
+    "min_price",
+    "max_delivery_time",
+    "search",
+    "ordering",
+    "page",
+    "page_size",
+    "cursor",
+    "expand",
+    "feature",
+]
+
+EPOCH_KEY = "offers:list:epoch"
+GLOBAL_GENERATION_KEY = "offers:list:gen"
+CREATOR_GENERATION_KEY = "offers:list:gen:{user_id}"
+HITS_KEY = "offers:list:hits"
+MISSES_KEY = "offers:list:misses"
+
+
+def get_timeout():
+    return getattr(settings, "OFFER_LIST_CACHE_TIMEOUT", 300)
+
+
+def build_key(request):
+    """Builds the cache key from the normalized list params and current generations."""
+    params = {}
+    for name in LIST_PARAMS:
+        value = request.query_params.get(name)
+        if value is not None:
+            params[name] = value.strip()
+
+    creator_id = params.get("creator_id")
+    generation_key = CREATOR_GENERATION_KEY.format(user_id=creator_id) if creator_id else GLOBAL_GENERATION_KEY
+    generations = [_generation(EPOCH_KEY), _generation(generation_key)]
+
+    raw = json.dumps([request.get_host(), generations, sorted(params.items())])
+    return "offers:list:" + hashlib.sha256(raw.encode()).hexdigest()
+
+
+def lookup(key):
+    """Returns cached response data and records a hit or miss."""
+    data = cache.get(key)
+    _increment(HITS_KEY if data is not None else MISSES_KEY)
+    return data
+
+
+def store(key, data):
+    cache.set(key, data, get_timeout())
+
+
+def invalidate_creator(user_id):
+    """Invalidates unfiltered lists and the lists filtered by this creator."""
+    _bump(GLOBAL_GENERATION_KEY)
+    _bump(CREATOR_GENERATION_KEY.format(user_id=user_id))
+
+
+def invalidate_all():
+    _bump(EPOCH_KEY)
+
+
+def get_stats():
+    return {
+        "hits": cache.get(HITS_KEY, 0),
+        "misses": cache.get(MISSES_KEY, 0),
+    }
+
+
+def reset_stats():
+    cache.set_many({HITS_KEY: 0, MISSES_KEY: 0}, None)
+
+
+def _generation(key):
+    """Generations start from a timestamp so an evicted counter never reuses old keys."""
+    value = cache.get(key)
+    if value is None:
+        cache.add(key, time.time_ns(), None)
+        value = cache.get(key)
+    return value
+
+
+def _bump(key):
+    cache.add(key, time.time_ns(), None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def _increment(key):
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        pass
@@ -0,0 +1,46 @@
+from offers_app.models import Feature, OfferDetail
+
+
+def normalize_feature(name):
+    """Collapses whitespace and case so equal features share one vocabulary row."""
+    return " ".join(name.split()).lower()[:255]
+
+
+def get_feature_names(features):
+    """Returns the normalized, de-duplicated names of a features JSON list."""
+    names = (normalize_feature(item) for item in features or [] if isinstance(item, str))
+    return {name for name in names if name}
+
+
+def sync_feature_tags(details):
+    """Points the feature_tags of the given saved details at their features lists."""
+    names_by_detail = {detail.pk: get_feature_names(detail.features) for detail in details}
+    if not names_by_detail:
+        return
+
+    feature_ids = _get_or_create_features(set().union(*names_by_detail.values()))
+    through = OfferDetail.feature_tags.through
+    through.objects.filter(offerdetail_id__in=names_by_detail.keys()).delete()
+    through.objects.bulk_create(
+        [
+            through(offerdetail_id=detail_id, feature_id=feature_ids[name])
+            for detail_id, names in names_by_detail.items()
+            for name in names
+        ]
+    )
+
+
+def offer_ids_with_feature(feature):
+    """Subquery of offer ids having a detail tagged with the feature."""
+    return OfferDetail.objects.filter(feature_tags__name=normalize_feature(feature)).values("offer_id")
+
+
+def _get_or_create_features(names):
+    if not names:
+        return {}
+    feature_ids = dict(Feature.objects.filter(name__in=names).values_list("name", "id"))
+    missing = names - feature_ids.keys()
+    if missing:
+        Feature.objects.bulk_create([Feature(name=name) for name in missing], ignore_conflicts=True)
+        feature_ids.update(Feature.objects.filter(name__in=missing).values_list("name", "id"))
+    return feature_ids
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from offers_app import cache as offer_list_cache
+from offers_app.min_values import backfill_min_values
+from offers_app.models import Offer, OfferDetail
+
+
+class Command(BaseCommand):
+    """Recomputes the denormalized min_price/min_delivery_time of every offer."""
+    help = "Backfills Offer.min_price and Offer.min_delivery_time from the offer details."
+
+    def handle(self, *args, **options):
+        updated = backfill_min_values(Offer, OfferDetail)
+        offer_list_cache.invalidate_all()
+        self.stdout.write(self.style.SUCCESS(f"Backfilled min values for {updated} offers."))
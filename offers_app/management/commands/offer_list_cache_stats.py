@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from offers_app import cache as offer_list_cache
+
+
+class Command(BaseCommand):
+    """Prints (and optionally resets) the offer list cache hit/miss counters."""
+    help = "Shows hit/miss counters of the anonymous offer list cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true", help="Reset the counters after printing.")
+        parser.add_argument("--flush", action="store_true", help="Invalidate every cached offer list.")
+
+    def handle(self, *args, **options):
+        stats = offer_list_cache.get_stats()
+        total = stats["hits"] + stats["misses"]
+        ratio = stats["hits"] / total if total else 0
+        self.stdout.write(f"hits={stats['hits']} misses={stats['misses']} hit_ratio={ratio:.2%}")
+
+        if options["reset"]:
+            offer_list_cache.reset_stats()
+        if options["flush"]:
+            offer_list_cache.invalidate_all()
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from offers_app import search
+
+
+class Command(BaseCommand):
+    """Recreates the offer full-text index and its sync triggers."""
+    help = "Rebuilds the FTS5 full-text index over offer titles and descriptions."
+
+    def handle(self, *args, **options):
+        if not search.is_supported():
+            self.stdout.write(self.style.WARNING("Full-text index requires SQLite; nothing to do."))
+            return
+        search.rebuild()
+        self.stdout.write(self.style.SUCCESS("Offer search index rebuilt."))
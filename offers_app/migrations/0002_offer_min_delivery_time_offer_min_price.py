@@ -0,0 +1,30 @@
+# Generated by Django 6.0.1 on 2026-10-18 18:12
+
+from django.db import migrations, models
+
+from offers_app.min_values import backfill_min_values
+
+
+def backfill(apps, schema_editor):
+    backfill_min_values(apps.get_model('offers_app', 'Offer'), apps.get_model('offers_app', 'OfferDetail'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offer',
+            name='min_delivery_time',
+            field=models.IntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='min_price',
+            field=models.FloatField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
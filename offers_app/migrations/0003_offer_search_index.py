@@ -0,0 +1,28 @@
+# Generated by Django 6.0.1 on 2026-10-18 18:40
+
+from django.db import migrations
+
+from offers_app import search
+
+
+# The sync triggers live on offers_app_offer, so any later migration that makes
+# SQLite rebuild that table drops them. OffersAppConfig re-creates them from a
+# post_migrate hook; migrations that run raw SQL against offers after such a
+# rebuild must call search.restore_triggers() themselves.
+def create_search_index(apps, schema_editor):
+    search.rebuild(schema_editor.connection)
+
+
+def drop_search_index(apps, schema_editor):
+    search.uninstall(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0002_offer_min_delivery_time_offer_min_price'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
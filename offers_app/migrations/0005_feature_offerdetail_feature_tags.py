@@ -0,0 +1,45 @@
+# Generated by Django 6.0.1 on 2026-10-18 18:21
+
+from django.db import migrations, models
+
+
+def backfill_feature_tags(apps, schema_editor):
+    Feature = apps.get_model('offers_app', 'Feature')
+    OfferDetail = apps.get_model('offers_app', 'OfferDetail')
+    Through = OfferDetail.feature_tags.through
+
+    feature_ids = {}
+    links = []
+    for detail_id, features in OfferDetail.objects.values_list('id', 'features').iterator(chunk_size=2000):
+        names = {' '.join(item.split()).lower()[:255] for item in features or [] if isinstance(item, str)}
+        for name in names - {''}:
+            if name not in feature_ids:
+                feature_ids[name] = Feature.objects.create(name=name).id
+            links.append(Through(offerdetail_id=detail_id, feature_id=feature_ids[name]))
+        if len(links) >= 2000:
+            Through.objects.bulk_create(links)
+            links = []
+    Through.objects.bulk_create(links)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0004_offer_updated_at_id_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Feature',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='offerdetail',
+            name='feature_tags',
+            field=models.ManyToManyField(blank=True, related_name='offer_details', to='offers_app.feature'),
+        ),
+        migrations.RunPython(backfill_feature_tags, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+from django.db.models import Min, OuterRef, Subquery
+
+
+def detail_min(detail_model, field):
+    """Subquery selecting the minimum of field over the details of the outer offer."""
+    return Subquery(
+        detail_model.objects.filter(offer=OuterRef("pk"))
+        .order_by()
+        .values("offer")
+        .annotate(value=Min(field))
+        .values("value")
+    )
+
+
+def backfill_min_values(offer_model, detail_model):
+    """Recomputes min_price/min_delivery_time of every offer with one UPDATE.
+
+    Takes the model classes so migrations can pass their historical models.
+    """
+    return offer_model.objects.update(
+        min_price=detail_min(detail_model, "price"),
+        min_delivery_time=detail_min(detail_model, "delivery_time_in_days"),
+    )
@@ -8,13 +8,29 @@ class Offer(models.Model):
     image = models.FileField(upload_to="offers/", null=True, blank=True)
     description = models.TextField(blank=True, default="")
 
+    min_price = models.FloatField(null=True, blank=True, db_index=True)
+    min_delivery_time = models.IntegerField(null=True, blank=True, db_index=True)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["updated_at", "id"], name="offer_updated_at_id_idx"),
+        ]
+
     def __str__(self):
         return self.title
 
 
+class Feature(models.Model):
+    """Normalized feature vocabulary shared by all offer details."""
+    name = models.CharField(max_length=255, unique=True)
+
+    def __str__(self):
+        return self.name
+
+
 class OfferDetail(models.Model):
     OFFER_TYPES = (
         ("basic", "basic"),
@@ -28,6 +44,7 @@ class OfferDetail(models.Model):
     delivery_time_in_days = models.IntegerField()
     price = models.FloatField()
     features = models.JSONField(default=list, blank=True)
+    feature_tags = models.ManyToManyField(Feature, related_name="offer_details", blank=True)
     offer_type = models.CharField(max_length=20, choices=OFFER_TYPES)
 
     def __str__(self):
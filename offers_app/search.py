@@ -0,0 +1,107 @@
+from django.db import connection
+from django.db.models import Q
+
+
+FTS_TABLE = "offers_app_offer_fts"
+
+CREATE_STATEMENTS = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, description,
+        content='offers_app_offer', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON offers_app_offer BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON offers_app_offer BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, description ON offers_app_offer BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
+DROP_STATEMENTS = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+
+def is_supported(conn=connection):
+    """The full-text index is only available on SQLite (FTS5)."""
+    return conn.vendor == "sqlite"
+
+
+def install(conn=connection):
+    """Creates the FTS5 table and the triggers keeping it in sync with offers."""
+    if not is_supported(conn):
+        return
+    with conn.cursor() as cursor:
+        for statement in CREATE_STATEMENTS:
+            cursor.execute(statement)
+
+
+def uninstall(conn=connection):
+    """Drops the FTS5 table and its triggers."""
+    if not is_supported(conn):
+        return
+    with conn.cursor() as cursor:
+        for statement in DROP_STATEMENTS:
+            cursor.execute(statement)
+
+
+def rebuild(conn=connection):
+    """Re-indexes every offer from the content table."""
+    if not is_supported(conn):
+        return
+    install(conn)
+    with conn.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+
+def restore_triggers(conn=connection):
+    """Re-creates missing sync triggers; SQLite drops them whenever it rebuilds offers_app_offer."""
+    if not is_supported(conn) or FTS_TABLE not in conn.introspection.table_names():
+        return
+    with conn.cursor() as cursor:
+        for statement in CREATE_STATEMENTS[1:]:
+            cursor.execute(statement)
+
+
+def build_match_query(search):
+    """Turns free text into an FTS5 query matching every term as a prefix."""
+    terms = [term.replace('"', '""') for term in search.split()]
+    return " ".join(f'"{term}"*' for term in terms if term)
+
+
+def search_offers(qs, search):
+    """Filters offers by the full-text index and annotates a relevance rank."""
+    match = build_match_query(search)
+    if not match:
+        return qs
+    if not is_supported():
+        return qs.filter(Q(title__icontains=search) | Q(description__icontains=search))
+
+    # Joins the FTS table once: SQLite drives the query from the MATCH and reads
+    # each offer by rowid, taking the bm25 rank from the same FTS row.
+    return qs.extra(
+        tables=[FTS_TABLE],
+        where=[f"{FTS_TABLE}.rowid = offers_app_offer.id", f"{FTS_TABLE} MATCH %s"],
+        params=[match],
+        select={"search_rank": f"{FTS_TABLE}.rank"},
+    ).order_by("search_rank", "-id")
@@ -0,0 +1,43 @@
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from offers_app import cache as offer_list_cache
+from offers_app.models import Offer, OfferDetail
+from profiles_app.models import UserProfile
+
+# Saves that only touch these fields (e.g. last_login on every login) leave user_details as is.
+UNLISTED_USER_FIELDS = frozenset({"last_login", "password"})
+
+
+@receiver([post_save, post_delete], sender=Offer)
+def invalidate_offer_lists_for_offer(sender, instance, **kwargs):
+    """Drops cached offer lists once the offer change is committed."""
+    user_id = instance.user_id
+    transaction.on_commit(lambda: offer_list_cache.invalidate_creator(user_id))
+
+
+@receiver([post_save, post_delete], sender=OfferDetail)
+def invalidate_offer_lists_for_detail(sender, instance, **kwargs):
+    """Drops cached offer lists once the detail change is committed."""
+    user_id = _detail_owner_id(instance)
+    if user_id is None:
+        return
+    transaction.on_commit(lambda: offer_list_cache.invalidate_creator(user_id))
+
+
+@receiver(post_save, sender=User)
+@receiver(post_save, sender=UserProfile)
+def invalidate_offer_lists_for_creator(sender, instance, update_fields=None, **kwargs):
+    """Drops cached offer lists embedding the user_details of a changed account or profile."""
+    if update_fields is not None and set(update_fields) <= UNLISTED_USER_FIELDS:
+        return
+    user_id = instance.pk if sender is User else instance.user_id
+    transaction.on_commit(lambda: offer_list_cache.invalidate_creator(user_id))
+
+
+def _detail_owner_id(detail):
+    if OfferDetail.offer.is_cached(detail):
+        return detail.offer.user_id
+    return Offer.objects.filter(id=detail.offer_id).values_list("user_id", flat=True).first()
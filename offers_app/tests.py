@@ -1,3 +1,50 @@
+from django.contrib.auth.models import User
 from django.test import TestCase
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
 
-# Create your tests here.
+from core.pagination import KeysetPagination
+from offers_app.models import Offer
+
+
+class OfferMinPriceCursorTests(TestCase):
+    """Keyset walks ordered by min_price over offers that have no details (min_price NULL)."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="biz", password="pw")
+        self.priced = [Offer.objects.create(user=self.user, title=f"L{i}", min_price=100 + i) for i in range(5)]
+        self.empty = [Offer.objects.create(user=self.user, title=f"empty{i}") for i in range(3)]
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def walk(self, url):
+        titles = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            titles += [offer["title"] for offer in response.data["results"]]
+            url = response.data["next"]
+        return titles
+
+    def test_descending_cursor_skips_offers_without_details(self):
+        for page_size in [2, 5, 6]:
+            titles = self.walk(f"/api/offers/?ordering=-min_price&cursor=&page_size={page_size}")
+            self.assertEqual(titles, ["L4", "L3", "L2", "L1", "L0"])
+
+    def test_ascending_cursor_skips_offers_without_details(self):
+        titles = self.walk("/api/offers/?ordering=min_price&cursor=&page_size=2")
+        self.assertEqual(titles, ["L0", "L1", "L2", "L3", "L4"])
+
+    def test_cursor_after_null_key_does_not_compare_with_null(self):
+        queryset = Offer.objects.order_by()
+        descending = self.keyset_titles(queryset, ("-min_price", "-id"), [None, self.empty[2].id])
+        self.assertEqual(descending, ["empty1", "empty0"])
+        ascending = self.keyset_titles(queryset, ("min_price", "id"), [None, self.empty[1].id])
+        self.assertEqual(ascending, ["empty2", "L0", "L1", "L2", "L3", "L4"])
+
+    def keyset_titles(self, queryset, ordering, position):
+        paginator = KeysetPagination()
+        paginator.orderings = {"": ordering}
+        paginator.ordering = ordering
+        request = Request(APIRequestFactory().get("/", {"cursor": paginator.encode_cursor(position)}))
+        return [offer.title for offer in paginator.paginate_queryset(queryset, request)]
@@ -0,0 +1,23 @@
+import csv
+import json
+
+
+class _Echo:
+    """File-like object handing each written CSV line straight back to the caller."""
+    def write(self, value):
+        return value
+
+
+def stream_csv(rows, fields):
+    """Yields a header line and one CSV line per row; JSON values are encoded inline."""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(fields)
+    for row in rows:
+        yield writer.writerow(
+            [json.dumps(row[field]) if isinstance(row[field], (list, dict)) else row[field] for field in fields]
+        )
+
+
+def stream_ndjson(rows):
+    for row in rows:
+        yield json.dumps(row) + "\n"
@@ -0,0 +1,119 @@
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.utils.encoders import JSONEncoder
+
+from auth_app.authentication import CachedTokenAuthentication
+from core.pagination import union_all
+from orders_app.events import ORDER_CREATED, broker
+from orders_app.models import Order
+from .serializers import OrderValuesSerializer
+
+
+KEEP_ALIVE_SECONDS = 15
+RETRY_MILLISECONDS = 3000
+MAX_CATCH_UP = 500
+
+
+@require_GET
+async def order_event_feed(request):
+    """Server-sent events of the user's new orders and status changes.
+
+    Reconnecting clients send Last-Event-ID (or ?since_id=), the id of the
+    newest order they have seen, and first receive the orders created since.
+    Between events an open feed only waits on its queue and never touches
+    the database. Needs the ASGI application in core/asgi.py.
+    """
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse({"detail": "The order feed is only served over ASGI."}, status=501)
+
+    user = await _authenticate(request)
+    if user is None:
+        return JsonResponse({"detail": "Authentication credentials were not provided or are invalid."}, status=401)
+
+    since_id = _get_since_id(request)
+    if since_id is False:
+        return JsonResponse({"since_id": "Expected an integer order id."}, status=400)
+
+    # Subscribe first so no order committed during the catch-up query is lost.
+    subscription = broker.subscribe(user.id)
+    try:
+        catch_up = [] if since_id is None else await sync_to_async(_get_catch_up)(user, since_id)
+    except BaseException:
+        broker.unsubscribe(user.id, subscription)
+        raise
+
+    response = StreamingHttpResponse(
+        _stream(user.id, subscription, catch_up, since_id or 0),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+async def _authenticate(request):
+    parts = request.headers.get("Authorization", "").split()
+    if len(parts) != 2 or parts[0].lower() != "token":
+        return None
+    try:
+        user, _ = await sync_to_async(CachedTokenAuthentication().authenticate_credentials)(parts[1])
+    except AuthenticationFailed:
+        return None
+    return user
+
+
+def _get_since_id(request):
+    """Returns the last seen order id, None when absent or False when malformed."""
+    value = request.headers.get("Last-Event-ID") or request.GET.get("since_id")
+    if not value:
+        return None
+    return int(value) if value.isdigit() else False
+
+
+def _get_catch_up(user, since_id):
+    serializer = OrderValuesSerializer()
+    branches = [
+        Order.objects.filter(customer_user=user, id__gt=since_id),
+        Order.objects.filter(business_user=user, id__gt=since_id).exclude(customer_user=user),
+    ]
+    rows = union_all([serializer.get_queryset(branch) for branch in branches]).order_by("id")
+    return serializer.serialize(rows[:MAX_CATCH_UP])
+
+
+async def _stream(user_id, subscription, catch_up, last_id):
+    try:
+        yield f"retry: {RETRY_MILLISECONDS}\n\n"
+        for order in catch_up:
+            last_id = order["id"]
+            yield _format_event(ORDER_CREATED, order)
+
+        while True:
+            try:
+                event = await subscription.get(KEEP_ALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if event is None:
+                return
+            order = event["order"]
+            if event["type"] == ORDER_CREATED:
+                if order["id"] <= last_id:
+                    continue
+                last_id = order["id"]
+            yield _format_event(event["type"], order)
+    finally:
+        broker.unsubscribe(user_id, subscription)
+
+
+def _format_event(event_type, order):
+    """Created events carry the order id as SSE id, which becomes the client's Last-Event-ID."""
+    lines = [f"event: {event_type}", f"data: {json.dumps(order, cls=JSONEncoder)}"]
+    if event_type == ORDER_CREATED:
+        lines.insert(0, f"id: {order['id']}")
+    return "\n".join(lines) + "\n\n"
@@ -0,0 +1,13 @@
+from rest_framework.renderers import JSONRenderer
+
+
+class CSVRenderer(JSONRenderer):
+    """Negotiates text/csv for streamed exports; error payloads are still rendered as JSON."""
+    media_type = "text/csv"
+    format = "csv"
+
+
+class NDJSONRenderer(JSONRenderer):
+    """Negotiates newline-delimited JSON for streamed exports."""
+    media_type = "application/x-ndjson"
+    format = "ndjson"
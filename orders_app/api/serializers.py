@@ -1,9 +1,19 @@
+from django.db import transaction
 from rest_framework import serializers
+from core.serializers import ValuesSerializer
+from orders_app.counters import record_status_change
 from orders_app.models import Order
 
 
 class OrderSerializer(serializers.ModelSerializer):
     """Full serializer for listing and retrieving orders."""
+    title = serializers.CharField(source="snapshot.title", read_only=True)
+    revisions = serializers.IntegerField(source="snapshot.revisions", read_only=True)
+    delivery_time_in_days = serializers.IntegerField(source="snapshot.delivery_time_in_days", read_only=True)
+    price = serializers.FloatField(source="snapshot.price", read_only=True)
+    features = serializers.JSONField(source="snapshot.features", read_only=True)
+    offer_type = serializers.CharField(source="snapshot.offer_type", read_only=True)
+
     class Meta:
         model = Order
         fields = [
@@ -23,6 +33,11 @@ class OrderSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+class OrderValuesSerializer(ValuesSerializer):
+    """Fast path of OrderSerializer built from .values() rows."""
+    serializer_class = OrderSerializer
+
+
 class OrderCreateSerializer(serializers.Serializer):
     """Creates an order based on an OfferDetail id."""
     offer_detail_id = serializers.IntegerField()
@@ -33,3 +48,19 @@ class OrderStatusSerializer(serializers.ModelSerializer):
     class Meta:
         model = Order
         fields = ["status"]
+
+    @transaction.atomic
+    def update(self, instance, validated_data):
+        old_status = instance.status
+        instance = super().update(instance, validated_data)
+        record_status_change(instance.business_user_id, old_status, instance.status)
+        return instance
+
+
+class OrderBulkStatusSerializer(serializers.Serializer):
+    """Validates a bulk status change: a list of order ids and a target status."""
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=500)
+    status = serializers.ChoiceField(choices=list(Order.STATUS_PREDECESSORS))
+
+    def validate_ids(self, value):
+        return list(dict.fromkeys(value))
@@ -1,12 +1,15 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import OrderViewSet, OrderCountView, CompletedOrderCountView
+from .feeds import order_event_feed
+from .views import OrderViewSet, OrderCountView, CompletedOrderCountView, OrderStatsView
 
 router = DefaultRouter()
 router.register(r"orders", OrderViewSet, basename="order")
 
 urlpatterns = [
+    path("orders/events/", order_event_feed, name="order-events"),
     path("", include(router.urls)),
     path("order-count/<int:business_user_id>/", OrderCountView.as_view(), name="order-count"),
     path("completed-order-count/<int:business_user_id>/", CompletedOrderCountView.as_view(), name="completed-order-count"),
+    path("order-stats/<int:business_user_id>/", OrderStatsView.as_view(), name="order-stats"),
 ]
@@ -1,33 +1,168 @@
+import datetime
+
 from django.contrib.auth.models import User
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import Q, prefetch_related_objects
+from django.http import Http404, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.mixins import ValuesListMixin
+from core.pagination import KeysetPagination, union_all
 from offers_app.models import OfferDetail
-from orders_app.models import Order
+from orders_app.archive import include_archived
+from orders_app import events as order_events
+from orders_app.counters import ARCHIVED_STATUSES, COUNTER_FIELDS, record_status_change
+from orders_app.models import ArchivedOrder, Order
+from orders_app.snapshots import get_snapshot
+from .exports import stream_csv, stream_ndjson
 from .permissions import IsCustomerUser, IsBusinessUser, IsStaffUser, IsOrderBusinessOwner
-from .serializers import OrderSerializer, OrderCreateSerializer, OrderStatusSerializer
+from .renderers import CSVRenderer, NDJSONRenderer
+from .serializers import (
+    OrderSerializer,
+    OrderValuesSerializer,
+    OrderCreateSerializer,
+    OrderStatusSerializer,
+    OrderBulkStatusSerializer,
+)
+
 
+class OrderCursorPagination(KeysetPagination):
+    """Keyset pagination over orders, newest first."""
+    orderings = {"-created_at": ("-created_at", "-id")}
 
-class OrderViewSet(viewsets.ModelViewSet):
-    """CRUD for orders with role-based permissions."""
+
+class OrderViewSet(ValuesListMixin, viewsets.ModelViewSet):
+    """CRUD for orders with role-based permissions; ?include_archived=true adds archived orders."""
     queryset = Order.objects.all()
+    values_serializer_class = OrderValuesSerializer
+    pagination_class = OrderCursorPagination
+    export_chunk_size = 2000
 
     def get_queryset(self):
+        return self._scope(Order.objects.select_related("snapshot"))
+
+    def _scope(self, qs):
         user = self.request.user
 
         if user.is_staff:
-            return Order.objects.all()
+            return qs
+
+        return qs.filter(Q(customer_user=user) | Q(business_user=user))
+
+    def retrieve(self, request, *args, **kwargs):
+        """Falls back to the archive for a missing order when archived orders are requested."""
+        if not include_archived(request):
+            return super().retrieve(request, *args, **kwargs)
+        try:
+            instance = self.get_object()
+        except Http404:
+            instance = get_object_or_404(self._scope(ArchivedOrder.objects.select_related("snapshot")), pk=kwargs["pk"])
+        return Response(self.get_serializer(instance).data)
 
-        return Order.objects.filter(Q(customer_user=user) | Q(business_user=user))
+    def list(self, request, *args, **kwargs):
+        """Lists the UNION ALL of the user's branches; ?cursor= switches to keyset pages."""
+        branches = self.get_list_branches()
+        values_serializer = self.get_values_serializer()
+        if values_serializer is not None:
+            branches = [values_serializer.get_queryset(branch) for branch in branches]
+
+        if self.paginator.cursor_query_param in request.query_params:
+            page = self.paginator.paginate_union(branches, request, view=self)
+            return self.get_paginated_response(self._serialize_list(page, values_serializer))
+        rows = union_all(branches).order_by("-created_at", "-id")
+        return Response(self._serialize_list(rows, values_serializer))
+
+    @action(detail=False, methods=["get"], renderer_classes=[CSVRenderer, NDJSONRenderer])
+    def export(self, request):
+        """Streams the user's orders as CSV or NDJSON (?format=csv|ndjson) in constant memory."""
+        serializer = OrderValuesSerializer(context=self.get_serializer_context())
+        branches = [serializer.get_queryset(branch) for branch in self.get_list_branches()]
+        rows = union_all(branches).order_by("created_at", "id").iterator(chunk_size=self.export_chunk_size)
+        rows = (serializer.to_representation(row) for row in rows)
+
+        renderer = request.accepted_renderer
+        if renderer.format == "ndjson":
+            content = stream_ndjson(rows)
+        else:
+            content = stream_csv(rows, [name for name, _, _ in serializer.mappers])
+        response = StreamingHttpResponse(content, content_type=renderer.media_type)
+        response["Content-Disposition"] = f'attachment; filename="orders.{renderer.format}"'
+        return response
+
+    def get_list_branches(self):
+        """Splits the customer/business OR into branches that each seek one index."""
+        models = [Order, ArchivedOrder] if include_archived(self.request) else [Order]
+        branches = []
+        for model in models:
+            branches.extend(self._apply_filters(branch) for branch in self._get_model_branches(model))
+        return branches
+
+    def _get_model_branches(self, model):
+        user = self.request.user
+        if user.is_staff:
+            return [model.objects.all()]
+
+        as_customer = model.objects.filter(customer_user=user)
+        as_business = model.objects.filter(business_user=user).exclude(customer_user=user)
+        return [as_customer, as_business]
+
+    def _apply_filters(self, qs):
+        order_status = self.request.query_params.get("status")
+        if order_status:
+            if order_status not in dict(Order.STATUS_CHOICES):
+                raise ValidationError({"status": f"'{order_status}' is not a valid status."})
+            qs = qs.filter(status=order_status)
+
+        created_after = self._get_datetime_param("created_after")
+        if created_after:
+            qs = qs.filter(created_at__gte=created_after)
+
+        created_before = self._get_datetime_param("created_before")
+        if created_before:
+            qs = qs.filter(created_at__lt=created_before)
+
+        return qs
+
+    def _get_datetime_param(self, name):
+        """Parses an ISO date or datetime query param; dates mean the start of that day."""
+        value = self.request.query_params.get(name)
+        if not value:
+            return None
+        parsed = parse_datetime(value)
+        if parsed is None:
+            try:
+                day = parse_date(value)
+            except ValueError:
+                day = None
+            if day is None:
+                raise ValidationError({name: "Expected an ISO 8601 date or datetime."})
+            parsed = datetime.datetime.combine(day, datetime.time.min)
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+
+    def _serialize_list(self, rows, values_serializer):
+        if values_serializer is not None:
+            return values_serializer.serialize(rows)
+        rows = list(rows)
+        prefetch_related_objects(rows, "snapshot")
+        return OrderSerializer(rows, many=True, context=self.get_serializer_context()).data
 
     def get_serializer_class(self):
         if self.action == "create":
             return OrderCreateSerializer
         if self.action == "partial_update":
             return OrderStatusSerializer
+        if self.action == "bulk_status":
+            return OrderBulkStatusSerializer
         return OrderSerializer
 
     def get_permissions(self):
@@ -37,10 +172,69 @@ class OrderViewSet(viewsets.ModelViewSet):
             return [IsAuthenticated(), IsCustomerUser()]
         if self.action == "partial_update":
             return [IsAuthenticated(), IsBusinessUser(), IsOrderBusinessOwner()]
+        if self.action == "bulk_status":
+            return [IsAuthenticated(), IsBusinessUser()]
         if self.action == "destroy":
             return [IsAuthenticated(), IsStaffUser()]
         return [IsAuthenticated()]
 
+    @action(detail=False, methods=["post"], url_path="bulk-status")
+    def bulk_status(self, request):
+        """Moves many of the business user's orders to a new status with one UPDATE."""
+        serializer = OrderBulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data["ids"]
+        new_status = serializer.validated_data["status"]
+
+        with transaction.atomic():
+            current = self._get_current_statuses(request.user, ids)
+            eligible = self._apply_bulk_status(request.user, current, new_status)
+
+        self._publish_status_changes(eligible)
+        results = [self._bulk_outcome(order_id, current, eligible) for order_id in ids]
+        return Response(
+            {"status": new_status, "updated": len(eligible), "results": results},
+            status=status.HTTP_200_OK,
+        )
+
+    def _get_current_statuses(self, business_user, ids):
+        orders = Order.objects.select_for_update().filter(business_user=business_user, id__in=ids)
+        return dict(orders.values_list("id", "status"))
+
+    def _apply_bulk_status(self, business_user, current, new_status):
+        predecessors = Order.STATUS_PREDECESSORS[new_status]
+        eligible = {order_id: old for order_id, old in current.items() if old in predecessors}
+        if not eligible:
+            return eligible
+
+        Order.objects.filter(
+            business_user=business_user,
+            id__in=eligible,
+            status__in=predecessors,
+        ).update(status=new_status, updated_at=timezone.now())
+
+        for old_status in predecessors:
+            count = sum(1 for old in eligible.values() if old == old_status)
+            record_status_change(business_user.id, old_status, new_status, count=count)
+        return eligible
+
+    def _publish_status_changes(self, order_ids):
+        """Loads the changed orders with one query, and only when a feed is listening."""
+        if not order_ids or not order_events.broker.has_subscribers():
+            return
+        serializer = OrderValuesSerializer()
+        for order in serializer.serialize(serializer.get_queryset(Order.objects.filter(id__in=order_ids))):
+            order_events.broker.publish(
+                order_events.ORDER_STATUS_CHANGED, [order["customer_user"], order["business_user"]], order
+            )
+
+    def _bulk_outcome(self, order_id, current, eligible):
+        if order_id in eligible:
+            return {"id": order_id, "outcome": "updated"}
+        if order_id in current:
+            return {"id": order_id, "outcome": "invalid_transition", "current_status": current[order_id]}
+        return {"id": order_id, "outcome": "not_found"}
+
     def create(self, request, *args, **kwargs):
         serializer = OrderCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -56,6 +250,7 @@ class OrderViewSet(viewsets.ModelViewSet):
         except OfferDetail.DoesNotExist:
             return None
 
+    @transaction.atomic
     def _create_order_from_detail(self, customer_user, offer_detail):
         if offer_detail is None:
             raise ValueError("OfferDetail not found.")
@@ -63,19 +258,33 @@ class OrderViewSet(viewsets.ModelViewSet):
         offer = offer_detail.offer
         business_user = offer.user
 
-        return Order.objects.create(
+        order = Order.objects.create(
             customer_user=customer_user,
             business_user=business_user,
             offer=offer,
             offer_detail=offer_detail,
-            title=offer_detail.title,
-            revisions=offer_detail.revisions,
-            delivery_time_in_days=offer_detail.delivery_time_in_days,
-            price=offer_detail.price,
-            features=offer_detail.features,
-            offer_type=offer_detail.offer_type,
+            snapshot=get_snapshot(offer_detail),
             status="in_progress",
         )
+        record_status_change(business_user.id, None, order.status)
+        self._publish(order_events.ORDER_CREATED, order)
+        return order
+
+    def perform_update(self, serializer):
+        old_status = serializer.instance.status
+        order = serializer.save()
+        if order.status != old_status:
+            self._publish(order_events.ORDER_STATUS_CHANGED, order)
+
+    def _publish(self, event_type, order):
+        order_events.publish_on_commit(
+            event_type, [order.customer_user_id, order.business_user_id], lambda: OrderSerializer(order).data
+        )
+
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        record_status_change(instance.business_user_id, instance.status, None)
+        instance.delete()
 
     def handle_exception(self, exc):
         if isinstance(exc, ValueError):
@@ -83,45 +292,55 @@ class OrderViewSet(viewsets.ModelViewSet):
         return super().handle_exception(exc)
 
 
-class OrderCountView(APIView):
-    """Returns count of in-progress orders for a business user."""
+class BusinessOrderCountView(APIView):
+    """Base view reading the maintained order counters of a business user.
+
+    Archived orders are counted separately and only added with ?include_archived=true.
+    """
     permission_classes = [IsAuthenticated]
 
     def get(self, request, business_user_id):
-        business_user = self._get_business_user(business_user_id)
-        if business_user is None:
+        counts = self._get_counts(business_user_id, include_archived(request))
+        if counts is None:
             return Response({"detail": "Business user not found."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(self.build_response(counts), status=status.HTTP_200_OK)
 
-        count = Order.objects.filter(business_user=business_user, status="in_progress").count()
-        return Response({"order_count": count}, status=status.HTTP_200_OK)
+    def build_response(self, counts):
+        raise NotImplementedError
 
-    def _get_business_user(self, user_id):
-        try:
-            user = User.objects.get(id=user_id)
-        except User.DoesNotExist:
-            return None
-        if not hasattr(user, "profile") or user.profile.type != "business":
+    def _get_counts(self, user_id, with_archived=False):
+        """Checks the business profile and reads the counters in one query."""
+        row = (
+            User.objects.filter(id=user_id, profile__type="business")
+            .values(*[f"order_counter__{field}" for field in COUNTER_FIELDS])
+            .first()
+        )
+        if row is None:
             return None
-        return user
+        counts = {field: row[f"order_counter__{field}"] or 0 for field in COUNTER_FIELDS}
+        if with_archived:
+            for status_name in ARCHIVED_STATUSES:
+                counts[status_name] += counts[f"archived_{status_name}"]
+        return counts
 
 
-class CompletedOrderCountView(APIView):
-    """Returns count of completed orders for a business user."""
-    permission_classes = [IsAuthenticated]
+class OrderCountView(BusinessOrderCountView):
+    """Returns count of in-progress orders for a business user."""
+    def build_response(self, counts):
+        return {"order_count": counts["in_progress"]}
 
-    def get(self, request, business_user_id):
-        business_user = self._get_business_user(business_user_id)
-        if business_user is None:
-            return Response({"detail": "Business user not found."}, status=status.HTTP_404_NOT_FOUND)
 
-        count = Order.objects.filter(business_user=business_user, status="completed").count()
-        return Response({"completed_order_count": count}, status=status.HTTP_200_OK)
+class CompletedOrderCountView(BusinessOrderCountView):
+    """Returns count of completed orders for a business user."""
+    def build_response(self, counts):
+        return {"completed_order_count": counts["completed"]}
 
-    def _get_business_user(self, user_id):
-        try:
-            user = User.objects.get(id=user_id)
-        except User.DoesNotExist:
-            return None
-        if not hasattr(user, "profile") or user.profile.type != "business":
-            return None
-        return user
+
+class OrderStatsView(BusinessOrderCountView):
+    """Returns in-progress, completed and cancelled order counts for a business user."""
+    def build_response(self, counts):
+        return {
+            "order_count": counts["in_progress"],
+            "completed_order_count": counts["completed"],
+            "cancelled_order_count": counts["cancelled"],
+        }
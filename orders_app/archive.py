@@ -0,0 +1,52 @@
+import collections
+import datetime
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from orders_app.counters import ARCHIVED_STATUSES, record_archived
+from orders_app.models import ArchivedOrder, Order
+
+
+INCLUDE_ARCHIVED_PARAM = "include_archived"
+
+
+def include_archived(request):
+    """True when the request opts into archived orders with ?include_archived=true."""
+    return request.query_params.get(INCLUDE_ARCHIVED_PARAM, "").lower() in ["1", "true", "yes"]
+
+
+def get_cutoff(days=None):
+    if days is None:
+        days = getattr(settings, "ORDER_ARCHIVE_AFTER_DAYS", 90)
+    return timezone.now() - datetime.timedelta(days=days)
+
+
+def archive_batch(cutoff, after_id=0, batch_size=1000):
+    """Moves the next batch of closed orders older than cutoff into the archive.
+
+    The batch is copied, deleted and counted in one transaction, so an
+    interrupted run leaves every order in exactly one table. Returns the
+    number of moved orders and the last id scanned, or (0, None) when done.
+    """
+    with transaction.atomic():
+        orders = list(
+            Order.objects.select_for_update()
+            .filter(id__gt=after_id, status__in=ARCHIVED_STATUSES, updated_at__lt=cutoff)
+            .order_by("id")[:batch_size]
+        )
+        if not orders:
+            return 0, None
+
+        ArchivedOrder.objects.bulk_create([_to_archived(order) for order in orders])
+        Order.objects.filter(id__in=[order.id for order in orders]).delete()
+
+        moved = collections.Counter((order.business_user_id, order.status) for order in orders)
+        for (business_user_id, status), count in moved.items():
+            record_archived(business_user_id, status, count)
+    return len(orders), orders[-1].id
+
+
+def _to_archived(order):
+    return ArchivedOrder(**{field.attname: getattr(order, field.attname) for field in Order._meta.concrete_fields})
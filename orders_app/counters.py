@@ -0,0 +1,57 @@
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+
+from core import aggregates
+from orders_app.models import ArchivedOrder, BusinessOrderCounter, Order
+
+
+STATUSES = [status for status, _ in Order.STATUS_CHOICES]
+ARCHIVED_STATUSES = ["completed", "cancelled"]
+COUNTER_FIELDS = STATUSES + [f"archived_{status}" for status in ARCHIVED_STATUSES]
+
+
+def record_status_change(business_user_id, old_status, new_status, count=1):
+    """Moves orders between counter columns; None means created or deleted.
+
+    Call inside the transaction that writes the orders so both commit together.
+    """
+    if old_status == new_status or not count:
+        return
+    deltas = {}
+    if old_status is not None:
+        deltas[old_status] = F(old_status) - count
+    if new_status is not None:
+        deltas[new_status] = F(new_status) + count
+
+    counters = BusinessOrderCounter.objects.filter(business_user_id=business_user_id)
+    if counters.update(**deltas):
+        return
+    try:
+        with transaction.atomic():
+            BusinessOrderCounter.objects.create(
+                business_user_id=business_user_id,
+                **({new_status: count} if new_status is not None else {}),
+            )
+    except IntegrityError:
+        counters.update(**deltas)
+
+
+def record_archived(business_user_id, status, count):
+    """Moves archived orders from the live counter column to its archived column."""
+    archived = f"archived_{status}"
+    BusinessOrderCounter.objects.filter(business_user_id=business_user_id).update(
+        **{status: F(status) - count, archived: F(archived) + count}
+    )
+
+
+def reconcile():
+    """Recomputes every counter from the order tables and returns how many were wrong."""
+    sources = [
+        (_grouped(Order), lambda row: {row["status"]: row["total"]}),
+        (_grouped(ArchivedOrder), lambda row: {f"archived_{row['status']}": row["total"]}),
+    ]
+    return aggregates.reconcile(BusinessOrderCounter, COUNTER_FIELDS, sources)
+
+
+def _grouped(model):
+    return model.objects.order_by().values("business_user", "status").annotate(total=Count("id"))
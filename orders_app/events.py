@@ -0,0 +1,85 @@
+import asyncio
+import threading
+
+from django.db import transaction
+
+
+ORDER_CREATED = "order_created"
+ORDER_STATUS_CHANGED = "order_status_changed"
+
+
+class Subscription:
+    """Event queue of one connected feed, fed from any thread via its event loop."""
+    def __init__(self, loop, maxsize):
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize)
+
+    def deliver(self, event):
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            pass  # The loop is closed, so the feed is already gone.
+
+    async def get(self, timeout):
+        """Returns the next event, or None after an overflow; raises TimeoutError when idle."""
+        return await asyncio.wait_for(self.queue.get(), timeout)
+
+    def _put(self, event):
+        if self.queue.full():
+            # A client this far behind is disconnected and catches up on reconnect.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            event = None
+        self.queue.put_nowait(event)
+
+
+class OrderEventBroker:
+    """In-process pub/sub fanning order events out to the feeds of the users involved.
+
+    Only feeds connected to the same process receive an event, so a deployment
+    with several ASGI workers needs sticky routing or a shared broker instead.
+    """
+    queue_size = 100
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = {}
+
+    def subscribe(self, user_id):
+        """Registers a feed of user_id; must be called from the feed's event loop."""
+        subscription = Subscription(asyncio.get_running_loop(), self.queue_size)
+        with self._lock:
+            self._subscriptions.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, user_id, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(user_id, set())
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                self._subscriptions.pop(user_id, None)
+
+    def has_subscribers(self, user_ids=None):
+        with self._lock:
+            if user_ids is None:
+                return bool(self._subscriptions)
+            return any(user_id in self._subscriptions for user_id in user_ids)
+
+    def publish(self, event_type, user_ids, payload):
+        event = {"type": event_type, "order": payload}
+        with self._lock:
+            subscriptions = [sub for user_id in set(user_ids) for sub in self._subscriptions.get(user_id, ())]
+        for subscription in subscriptions:
+            subscription.deliver(event)
+
+
+broker = OrderEventBroker()
+
+
+def publish_on_commit(event_type, user_ids, build_payload):
+    """Publishes once the current transaction commits; build_payload only runs if a feed listens."""
+    def publish():
+        if broker.has_subscribers(user_ids):
+            broker.publish(event_type, user_ids, build_payload())
+
+    transaction.on_commit(publish)
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from orders_app.archive import archive_batch, get_cutoff
+
+
+class Command(BaseCommand):
+    """Moves old completed and cancelled orders into the archive table in batches."""
+    help = (
+        "Archives completed/cancelled orders not updated for --older-than-days days "
+        "(default: settings.ORDER_ARCHIVE_AFTER_DAYS). Each batch is its own transaction; "
+        "rerun, or pass the printed --after-id, to resume an interrupted run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--older-than-days", type=int, default=None)
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--after-id", type=int, default=0)
+
+    def handle(self, *args, **options):
+        cutoff = get_cutoff(options["older_than_days"])
+        after_id = options["after_id"]
+        total = 0
+
+        while True:
+            moved, last_id = archive_batch(cutoff, after_id, options["batch_size"])
+            if last_id is None:
+                break
+            total += moved
+            after_id = last_id
+            self.stdout.write(f"Archived {moved} orders up to id {last_id}.")
+
+        self.stdout.write(self.style.SUCCESS(f"Archived {total} orders older than {cutoff:%Y-%m-%d %H:%M}."))
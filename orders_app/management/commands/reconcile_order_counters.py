@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from orders_app.counters import reconcile
+
+
+class Command(BaseCommand):
+    """Repairs drift between the business order counters and the orders table."""
+    help = "Recomputes BusinessOrderCounter rows from the orders table."
+
+    def handle(self, *args, **options):
+        repaired = reconcile()
+        self.stdout.write(self.style.SUCCESS(f"Reconciled order counters, {repaired} repaired."))
@@ -0,0 +1,39 @@
+# Generated by Django 6.0.1 on 2026-10-18 18:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_counters(apps, schema_editor):
+    Order = apps.get_model('orders_app', 'Order')
+    BusinessOrderCounter = apps.get_model('orders_app', 'BusinessOrderCounter')
+
+    counters = {}
+    grouped = Order.objects.order_by().values('business_user', 'status').annotate(total=Count('id'))
+    for row in grouped:
+        counter = counters.setdefault(row['business_user'], BusinessOrderCounter(business_user_id=row['business_user']))
+        setattr(counter, row['status'], row['total'])
+    BusinessOrderCounter.objects.bulk_create(counters.values())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('orders_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessOrderCounter',
+            fields=[
+                ('business_user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='order_counter', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('in_progress', models.IntegerField(default=0)),
+                ('completed', models.IntegerField(default=0)),
+                ('cancelled', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 6.0.1 on 2026-10-18 18:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0005_feature_offerdetail_feature_tags'),
+        ('orders_app', '0003_order_list_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='businessordercounter',
+            name='archived_cancelled',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='businessordercounter',
+            name='archived_completed',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='ArchivedOrder',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('revisions', models.IntegerField()),
+                ('delivery_time_in_days', models.IntegerField()),
+                ('price', models.FloatField()),
+                ('features', models.JSONField(blank=True, default=list)),
+                ('offer_type', models.CharField(max_length=20)),
+                ('status', models.CharField(choices=[('in_progress', 'in_progress'), ('completed', 'completed'), ('cancelled', 'cancelled')], max_length=20)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('business_user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_orders_as_business', to=settings.AUTH_USER_MODEL)),
+                ('customer_user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_orders_as_customer', to=settings.AUTH_USER_MODEL)),
+                ('offer', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='archived_orders', to='offers_app.offer')),
+                ('offer_detail', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='archived_orders', to='offers_app.offerdetail')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['customer_user', 'created_at'], name='archived_customer_created_idx'), models.Index(fields=['business_user', 'created_at'], name='archived_business_created_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,198 @@
+# Generated by Django 6.0.1 on 2026-10-18 19:05
+
+import hashlib
+import json
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# Frozen copies of orders_app.snapshots, which imports the live models.
+SNAPSHOT_FIELDS = ['title', 'revisions', 'delivery_time_in_days', 'price', 'features', 'offer_type']
+
+
+def content_hash(content):
+    canonical = json.dumps(content, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def backfill_snapshots(apps, schema_editor):
+    OrderSnapshot = apps.get_model('orders_app', 'OrderSnapshot')
+    snapshot_ids = {}
+
+    for model_name in ['Order', 'ArchivedOrder']:
+        model = apps.get_model('orders_app', model_name)
+        updates = []
+        for order in model.objects.only('id', *SNAPSHOT_FIELDS).iterator(chunk_size=2000):
+            content = {field: getattr(order, field) for field in SNAPSHOT_FIELDS}
+            key = content_hash(content)
+            if key not in snapshot_ids:
+                snapshot_ids[key] = OrderSnapshot.objects.create(content_hash=key, **content).id
+            order.snapshot_id = snapshot_ids[key]
+            updates.append(order)
+        model.objects.bulk_update(updates, ['snapshot'], batch_size=2000)
+
+
+def restore_snapshot_fields(apps, schema_editor):
+    for model_name in ['Order', 'ArchivedOrder']:
+        model = apps.get_model('orders_app', model_name)
+        updates = []
+        for order in model.objects.select_related('snapshot').iterator(chunk_size=2000):
+            for field in SNAPSHOT_FIELDS:
+                setattr(order, field, getattr(order.snapshot, field))
+            updates.append(order)
+        model.objects.bulk_update(updates, SNAPSHOT_FIELDS, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders_app', '0004_archivedorder'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(max_length=64, unique=True)),
+                ('title', models.CharField(max_length=255)),
+                ('revisions', models.IntegerField()),
+                ('delivery_time_in_days', models.IntegerField()),
+                ('price', models.FloatField()),
+                ('features', models.JSONField(blank=True, default=list)),
+                ('offer_type', models.CharField(max_length=20)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='snapshot',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='orders', to='orders_app.ordersnapshot'),
+        ),
+        migrations.AddField(
+            model_name='archivedorder',
+            name='snapshot',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='archived_orders', to='orders_app.ordersnapshot'),
+        ),
+        # Nullable so that, when reversing, the re-added columns can be filled
+        # by restore_snapshot_fields before they become NOT NULL again.
+        migrations.AlterField(
+            model_name='order',
+            name='title',
+            field=models.CharField(max_length=255, null=True),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='revisions',
+            field=models.IntegerField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='delivery_time_in_days',
+            field=models.IntegerField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='price',
+            field=models.FloatField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='features',
+            field=models.JSONField(blank=True, default=list, null=True),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='offer_type',
+            field=models.CharField(max_length=20, null=True),
+        ),
+        migrations.AlterField(
+            model_name='archivedorder',
+            name='title',
+            field=models.CharField(max_length=255, null=True),
+        ),
+        migrations.AlterField(
+            model_name='archivedorder',
+            name='revisions',
+            field=models.IntegerField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='archivedorder',
+            name='delivery_time_in_days',
+            field=models.IntegerField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='archivedorder',
+            name='price',
+            field=models.FloatField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='archivedorder',
+            name='features',
+            field=models.JSONField(blank=True, default=list, null=True),
+        ),
+        migrations.AlterField(
+            model_name='archivedorder',
+            name='offer_type',
+            field=models.CharField(max_length=20, null=True),
+        ),
+        migrations.RunPython(backfill_snapshots, restore_snapshot_fields),
+        migrations.RemoveField(
+            model_name='order',
+            name='title',
+        ),
+        migrations.RemoveField(
+            model_name='order',
+            name='revisions',
+        ),
+        migrations.RemoveField(
+            model_name='order',
+            name='delivery_time_in_days',
+        ),
+        migrations.RemoveField(
+            model_name='order',
+            name='price',
+        ),
+        migrations.RemoveField(
+            model_name='order',
+            name='features',
+        ),
+        migrations.RemoveField(
+            model_name='order',
+            name='offer_type',
+        ),
+        migrations.RemoveField(
+            model_name='archivedorder',
+            name='title',
+        ),
+        migrations.RemoveField(
+            model_name='archivedorder',
+            name='revisions',
+        ),
+        migrations.RemoveField(
+            model_name='archivedorder',
+            name='delivery_time_in_days',
+        ),
+        migrations.RemoveField(
+            model_name='archivedorder',
+            name='price',
+        ),
+        migrations.RemoveField(
+            model_name='archivedorder',
+            name='features',
+        ),
+        migrations.RemoveField(
+            model_name='archivedorder',
+            name='offer_type',
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='snapshot',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='orders', to='orders_app.ordersnapshot'),
+        ),
+        migrations.AlterField(
+            model_name='archivedorder',
+            name='snapshot',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='archived_orders', to='orders_app.ordersnapshot'),
+        ),
+    ]
@@ -3,6 +3,25 @@ from django.contrib.auth.models import User
 from offers_app.models import Offer, OfferDetail
 
 
+class OrderSnapshot(models.Model):
+    """Offer detail content an order was placed with, stored once per distinct content.
+
+    content_hash is the SHA-256 of the canonical JSON of the fields below, so
+    every order of an unchanged OfferDetail shares one row.
+    """
+    content_hash = models.CharField(max_length=64, unique=True)
+
+    title = models.CharField(max_length=255)
+    revisions = models.IntegerField()
+    delivery_time_in_days = models.IntegerField()
+    price = models.FloatField()
+    features = models.JSONField(default=list, blank=True)
+    offer_type = models.CharField(max_length=20)
+
+    def __str__(self):
+        return f"Snapshot {self.content_hash[:12]} ({self.title})"
+
+
 class Order(models.Model):
     """Stores an order created by a customer based on an OfferDetail snapshot."""
 
@@ -12,6 +31,12 @@ class Order(models.Model):
         ("cancelled", "cancelled"),
     )
 
+    # Statuses an order may be moved out of to reach each target status in bulk.
+    STATUS_PREDECESSORS = {
+        "completed": ["in_progress"],
+        "cancelled": ["in_progress"],
+    }
+
     customer_user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="orders_as_customer"
     )
@@ -21,18 +46,70 @@ class Order(models.Model):
 
     offer = models.ForeignKey(Offer, null=True, blank=True, on_delete=models.SET_NULL, related_name="orders")
     offer_detail = models.ForeignKey(OfferDetail, null=True, blank=True, on_delete=models.SET_NULL, related_name="orders")
-
-    title = models.CharField(max_length=255)
-    revisions = models.IntegerField()
-    delivery_time_in_days = models.IntegerField()
-    price = models.FloatField()
-    features = models.JSONField(default=list, blank=True)
-    offer_type = models.CharField(max_length=20)
+    snapshot = models.ForeignKey(OrderSnapshot, on_delete=models.PROTECT, related_name="orders")
 
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="in_progress")
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["customer_user", "created_at"], name="order_customer_created_idx"),
+            models.Index(fields=["business_user", "created_at"], name="order_business_created_idx"),
+            models.Index(fields=["business_user", "status", "created_at"], name="order_business_status_idx"),
+        ]
+
     def __str__(self):
         return f"Order {self.id} ({self.status})"
+
+
+class ArchivedOrder(models.Model):
+    """Completed or cancelled order moved out of the hot Order table.
+
+    Columns mirror Order one to one and keep the original id, so archived
+    rows can be combined with live ones in a UNION ALL and found by the same pk.
+    """
+    id = models.BigIntegerField(primary_key=True)
+
+    customer_user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="archived_orders_as_customer"
+    )
+    business_user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="archived_orders_as_business"
+    )
+
+    offer = models.ForeignKey(Offer, null=True, blank=True, on_delete=models.SET_NULL, related_name="archived_orders")
+    offer_detail = models.ForeignKey(
+        OfferDetail, null=True, blank=True, on_delete=models.SET_NULL, related_name="archived_orders"
+    )
+    snapshot = models.ForeignKey(OrderSnapshot, on_delete=models.PROTECT, related_name="archived_orders")
+
+    status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES)
+
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["customer_user", "created_at"], name="archived_customer_created_idx"),
+            models.Index(fields=["business_user", "created_at"], name="archived_business_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"Archived order {self.id} ({self.status})"
+
+
+class BusinessOrderCounter(models.Model):
+    """Per-business order counts by status, maintained alongside every order write."""
+    business_user = models.OneToOneField(
+        User, on_delete=models.CASCADE, primary_key=True, related_name="order_counter"
+    )
+    in_progress = models.IntegerField(default=0)
+    completed = models.IntegerField(default=0)
+    cancelled = models.IntegerField(default=0)
+    archived_completed = models.IntegerField(default=0)
+    archived_cancelled = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"Order counter of user {self.business_user_id}"
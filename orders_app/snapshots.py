@@ -0,0 +1,24 @@
+import hashlib
+import json
+
+from orders_app.models import OrderSnapshot
+
+
+SNAPSHOT_FIELDS = ["title", "revisions", "delivery_time_in_days", "price", "features", "offer_type"]
+
+
+def get_content(source):
+    return {field: getattr(source, field) for field in SNAPSHOT_FIELDS}
+
+
+def content_hash(content):
+    """SHA-256 of the canonical JSON of a snapshot's content."""
+    canonical = json.dumps(content, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def get_snapshot(offer_detail):
+    """Returns the snapshot of the detail's current content, writing one only for new content."""
+    content = get_content(offer_detail)
+    snapshot, _ = OrderSnapshot.objects.get_or_create(content_hash=content_hash(content), defaults=content)
+    return snapshot
@@ -1,6 +1,8 @@
 from pathlib import Path
 from rest_framework import serializers
+from core.serializers import ValuesSerializer
 from profiles_app.models import UserProfile
+from reviews_app.ratings import build_summary
 
 
 NON_NULL_FIELDS = ["first_name", "last_name", "location", "tel", "description", "working_hours"]
@@ -24,6 +26,7 @@ class ProfileSerializer(serializers.ModelSerializer):
     email = serializers.EmailField(source="user.email", required=False)
 
     file = serializers.SerializerMethodField()
+    rating_summary = serializers.SerializerMethodField()
 
     class Meta:
         model = UserProfile
@@ -40,6 +43,7 @@ class ProfileSerializer(serializers.ModelSerializer):
             "type",
             "email",
             "created_at",
+            "rating_summary",
         ]
         read_only_fields = ["type", "created_at"]
 
@@ -49,6 +53,12 @@ class ProfileSerializer(serializers.ModelSerializer):
             return None
         return Path(obj.file.name).name
 
+    def get_rating_summary(self, obj):
+        """Review aggregate of business profiles; None for customers."""
+        if obj.type != "business":
+            return None
+        return build_summary(getattr(obj.user, "rating_summary", None))
+
     def update(self, instance, validated_data):
         """Updates User fields and UserProfile fields from a single payload."""
         user_data = validated_data.pop("user", {})
@@ -108,4 +118,19 @@ class ProfileListSerializer(serializers.ModelSerializer):
     def to_representation(self, instance):
         """Ensures selected text fields are never null in the response."""
         data = super().to_representation(instance)
-        return ensure_non_null_strings(data)
\ No newline at end of file
+        return ensure_non_null_strings(data)
+
+
+class ProfileListValuesSerializer(ValuesSerializer):
+    """Fast path of ProfileListSerializer built from .values() rows."""
+    serializer_class = ProfileListSerializer
+    extra_lookups = ["file", "user_id", "created_at"]
+
+    def get_file(self, row):
+        if not row["file"]:
+            return None
+        return Path(row["file"]).name
+
+    def to_representation(self, row):
+        data = super().to_representation(row)
+        return ensure_non_null_strings(data)
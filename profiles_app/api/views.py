@@ -1,27 +1,61 @@
 from rest_framework import generics
 from rest_framework.permissions import IsAuthenticated
+from core.mixins import ValuesListMixin
+from core.pagination import OptionalKeysetPagination
 from profiles_app.models import UserProfile
-from .serializers import ProfileSerializer, ProfileListSerializer
+from .serializers import ProfileSerializer, ProfileListSerializer, ProfileListValuesSerializer
 from .permissions import IsProfileOwnerOrReadOnly
 
 
 class ProfileDetailView(generics.RetrieveUpdateAPIView):
-    queryset = UserProfile.objects.select_related("user").all()
+    queryset = UserProfile.objects.select_related("user", "user__rating_summary").all()
     serializer_class = ProfileSerializer
     permission_classes = [IsAuthenticated, IsProfileOwnerOrReadOnly]
 
 
-class BusinessProfileListView(generics.ListAPIView):
+class ProfileCursorPagination(OptionalKeysetPagination):
+    """Keyset pages by creation time with the user id as tiebreaker."""
+    orderings = {
+        "-created_at": ("-created_at", "-user_id"),
+        "created_at": ("created_at", "user_id"),
+    }
+
+
+class ProfileListView(ValuesListMixin, generics.ListAPIView):
+    """Profiles of one type, filterable by ?location= and ?search= over username and name."""
     serializer_class = ProfileListSerializer
+    values_serializer_class = ProfileListValuesSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = ProfileCursorPagination
+    profile_type = None
 
     def get_queryset(self):
-        return UserProfile.objects.select_related("user").filter(type="business")
+        qs = UserProfile.objects.select_related("user").filter(type=self.profile_type)
+        qs = self._apply_filters(qs)
+        return self._apply_ordering(qs)
 
+    def _apply_filters(self, qs):
+        location = self.request.query_params.get("location")
+        if location:
+            qs = qs.filter(location=location.strip())
 
-class CustomerProfileListView(generics.ListAPIView):
-    serializer_class = ProfileListSerializer
-    permission_classes = [IsAuthenticated]
+        search = self.request.query_params.get("search", "").strip().lower()
+        if search:
+            qs = qs.filter(search_name__contains=search)
 
-    def get_queryset(self):
-        return UserProfile.objects.select_related("user").filter(type="customer")
+        return qs
+
+    def _apply_ordering(self, qs):
+        ordering = self.request.query_params.get("ordering")
+        allowed = ["created_at", "-created_at"]
+        if ordering in allowed:
+            return qs.order_by(ordering)
+        return qs
+
+
+class BusinessProfileListView(ProfileListView):
+    profile_type = "business"
+
+
+class CustomerProfileListView(ProfileListView):
+    profile_type = "customer"
@@ -0,0 +1,40 @@
+# Generated by Django 6.0.1 on 2026-10-18 19:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_search_names(apps, schema_editor):
+    UserProfile = apps.get_model('profiles_app', 'UserProfile')
+    profiles = []
+    for profile in UserProfile.objects.select_related('user').iterator(chunk_size=2000):
+        user = profile.user
+        names = [user.username, user.first_name, user.last_name]
+        profile.search_name = ' '.join(name for name in names if name).lower()
+        profiles.append(profile)
+    UserProfile.objects.bulk_update(profiles, ['search_name'], batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles_app', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='search_name',
+            field=models.CharField(blank=True, default='', editable=False, max_length=500),
+        ),
+        migrations.RunPython(backfill_search_names, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=models.Index(fields=['type', 'location'], name='profile_type_location_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=models.Index(fields=['type', 'created_at'], name='profile_type_created_idx'),
+        ),
+    ]
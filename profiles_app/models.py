@@ -2,6 +2,14 @@ from django.db import models
 from django.contrib.auth.models import User
 
 
+SEARCH_NAME_SOURCES = ["username", "first_name", "last_name"]
+
+
+def build_search_name(user):
+    """Lowercased username and full name that profile search matches against."""
+    return " ".join(getattr(user, field) for field in SEARCH_NAME_SOURCES if getattr(user, field)).lower()
+
+
 class UserProfile(models.Model):
     USER_TYPES = (
         ("customer", "customer"),
@@ -26,5 +34,20 @@ class UserProfile(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Denormalized from the User so listings filter without joining or lowercasing per row.
+    search_name = models.CharField(max_length=500, blank=True, default="", editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["type", "location"], name="profile_type_location_idx"),
+            models.Index(fields=["type", "created_at"], name="profile_type_created_idx"),
+        ]
+
     def __str__(self):
-        return f"{self.user.username} ({self.type})"
\ No newline at end of file
+        return f"{self.user.username} ({self.type})"
+
+    def save(self, *args, **kwargs):
+        self.search_name = build_search_name(self.user)
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "search_name"}
+        super().save(*args, **kwargs)
\ No newline at end of file
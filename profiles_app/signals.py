@@ -0,0 +1,14 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from profiles_app.models import SEARCH_NAME_SOURCES, UserProfile, build_search_name
+
+
+@receiver(post_save, sender=User)
+def sync_profile_search_name(sender, instance, created, update_fields=None, **kwargs):
+    """Keeps UserProfile.search_name in step with name changes made on the User alone."""
+    if created or (update_fields is not None and not set(update_fields) & set(SEARCH_NAME_SOURCES)):
+        return
+    search_name = build_search_name(instance)
+    UserProfile.objects.filter(user=instance).exclude(search_name=search_name).update(search_name=search_name)
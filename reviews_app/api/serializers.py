@@ -1,5 +1,9 @@
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
+from core.serializers import ValuesSerializer
 from reviews_app.models import Review
+from reviews_app.ratings import record_review_change
 
 
 class ReviewSerializer(serializers.ModelSerializer):
@@ -18,8 +22,17 @@ class ReviewSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+class ReviewValuesSerializer(ValuesSerializer):
+    """Fast path of ReviewSerializer built from .values() rows."""
+    serializer_class = ReviewSerializer
+
+
+DUPLICATE_REVIEW_MESSAGE = "You have already reviewed this business user."
+
+
 class ReviewCreateSerializer(serializers.ModelSerializer):
     """Creates a review and returns the created review including its id."""
+    business_user = serializers.PrimaryKeyRelatedField(queryset=User.objects.select_related("profile"))
     reviewer = serializers.IntegerField(source="reviewer.id", read_only=True)
 
     class Meta:
@@ -41,24 +54,29 @@ class ReviewCreateSerializer(serializers.ModelSerializer):
         return value
 
     def validate(self, attrs):
-        request = self.context["request"]
         business_user = attrs["business_user"]
 
         if not hasattr(business_user, "profile") or business_user.profile.type != "business":
             raise serializers.ValidationError({"business_user": "User is not a business profile."})
 
-        exists = Review.objects.filter(
-            business_user=business_user,
-            reviewer=request.user,
-        ).exists()
-        if exists:
-            raise serializers.ValidationError({"detail": "You have already reviewed this business user."})
-
         return attrs
 
     def create(self, validated_data):
+        """Inserts directly; unique_review_per_business_and_reviewer rejects duplicates."""
         request = self.context["request"]
-        return Review.objects.create(reviewer=request.user, **validated_data)
+        try:
+            with transaction.atomic():
+                review = Review.objects.create(reviewer=request.user, **validated_data)
+                record_review_change(review.business_user_id, None, review.rating)
+        except IntegrityError:
+            if not self._is_duplicate(request.user, validated_data["business_user"]):
+                raise
+            raise serializers.ValidationError({"detail": [DUPLICATE_REVIEW_MESSAGE]})
+        return review
+
+    def _is_duplicate(self, reviewer, business_user):
+        """Only runs after a failed INSERT, to tell the unique constraint from other integrity errors."""
+        return Review.objects.filter(business_user=business_user, reviewer=reviewer).exists()
 
 
 class ReviewUpdateSerializer(serializers.ModelSerializer):
@@ -71,3 +89,10 @@ class ReviewUpdateSerializer(serializers.ModelSerializer):
         if value < 1 or value > 5:
             raise serializers.ValidationError("Rating must be between 1 and 5.")
         return value
+
+    @transaction.atomic
+    def update(self, instance, validated_data):
+        old_rating = instance.rating
+        instance = super().update(instance, validated_data)
+        record_review_change(instance.business_user_id, old_rating, instance.rating)
+        return instance
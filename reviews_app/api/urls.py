@@ -1,7 +1,8 @@
 from django.urls import path
-from .views import ReviewListCreateView, ReviewDetailView
+from .views import ReviewListCreateView, ReviewDetailView, ReviewSummaryView
 
 urlpatterns = [
     path("reviews/", ReviewListCreateView.as_view(), name="reviews"),
     path("reviews/<int:pk>/", ReviewDetailView.as_view(), name="review-detail"),
+    path("reviews/summary/", ReviewSummaryView.as_view(), name="review-summary"),
 ]
@@ -1,13 +1,32 @@
+from django.db import transaction
 from rest_framework import generics
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from core.mixins import ValuesListMixin
+from core.pagination import OptionalKeysetPagination
+from core.params import parse_id_list
 from reviews_app.models import Review
+from reviews_app.ratings import get_summaries, record_review_change
 from .permissions import IsCustomerUser, IsReviewOwner
-from .serializers import ReviewSerializer, ReviewCreateSerializer, ReviewUpdateSerializer
+from .serializers import ReviewSerializer, ReviewValuesSerializer, ReviewCreateSerializer, ReviewUpdateSerializer
 
 
-class ReviewListCreateView(generics.ListCreateAPIView):
+class ReviewCursorPagination(OptionalKeysetPagination):
+    """Keyset pages in the requested ordering with id as tiebreaker."""
+    orderings = {
+        "-updated_at": ("-updated_at", "-id"),
+        "updated_at": ("updated_at", "id"),
+        "rating": ("rating", "id"),
+        "-rating": ("-rating", "-id"),
+    }
+
+
+class ReviewListCreateView(ValuesListMixin, generics.ListCreateAPIView):
     """Lists reviews and allows customers to create a new review."""
     queryset = Review.objects.all()
+    values_serializer_class = ReviewValuesSerializer
+    pagination_class = ReviewCursorPagination
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
@@ -53,3 +72,25 @@ class ReviewDetailView(generics.RetrieveUpdateDestroyAPIView):
         if self.request.method == "PATCH":
             return ReviewUpdateSerializer
         return ReviewSerializer
+
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        record_review_change(instance.business_user_id, instance.rating, None)
+        instance.delete()
+
+
+class ReviewSummaryView(APIView):
+    """Review count, average rating and star histogram for a batch of business users."""
+    permission_classes = [IsAuthenticated]
+    max_batch_size = 100
+
+    def get(self, request):
+        raw_ids = request.query_params.get("business_user_ids", "")
+        ids = parse_id_list(raw_ids, "business_user_ids", self.max_batch_size)
+        summaries = get_summaries(ids)
+        return Response(
+            {
+                "results": [summaries[user_id] for user_id in ids if user_id in summaries],
+                "missing": [user_id for user_id in ids if user_id not in summaries],
+            }
+        )
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from reviews_app.ratings import reconcile
+
+
+class Command(BaseCommand):
+    """Repairs drift between the business rating aggregates and the reviews table."""
+    help = "Recomputes BusinessRating rows from the reviews table."
+
+    def handle(self, *args, **options):
+        repaired = reconcile()
+        self.stdout.write(self.style.SUCCESS(f"Reconciled business ratings, {repaired} repaired."))
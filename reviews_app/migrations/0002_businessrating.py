@@ -0,0 +1,46 @@
+# Generated by Django 6.0.1 on 2026-10-18 19:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_ratings(apps, schema_editor):
+    Review = apps.get_model('reviews_app', 'Review')
+    BusinessRating = apps.get_model('reviews_app', 'BusinessRating')
+
+    aggregates = {}
+    grouped = Review.objects.order_by().values('business_user', 'rating').annotate(total=Count('id'))
+    for row in grouped:
+        aggregate = aggregates.setdefault(row['business_user'], BusinessRating(business_user_id=row['business_user']))
+        aggregate.review_count += row['total']
+        aggregate.rating_sum += row['rating'] * row['total']
+        if 1 <= row['rating'] <= 5:
+            setattr(aggregate, f"stars_{row['rating']}", row['total'])
+    BusinessRating.objects.bulk_create(aggregates.values())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('reviews_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessRating',
+            fields=[
+                ('business_user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='rating_summary', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('review_count', models.IntegerField(default=0)),
+                ('rating_sum', models.IntegerField(default=0)),
+                ('stars_1', models.IntegerField(default=0)),
+                ('stars_2', models.IntegerField(default=0)),
+                ('stars_3', models.IntegerField(default=0)),
+                ('stars_4', models.IntegerField(default=0)),
+                ('stars_5', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_ratings, migrations.RunPython.noop),
+    ]
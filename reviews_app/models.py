@@ -23,6 +23,28 @@ class Review(models.Model):
                 name="unique_review_per_business_and_reviewer",
             )
         ]
+        indexes = [
+            models.Index(fields=["business_user", "updated_at"], name="review_business_updated_idx"),
+            models.Index(fields=["business_user", "rating"], name="review_business_rating_idx"),
+            models.Index(fields=["reviewer", "updated_at"], name="review_reviewer_updated_idx"),
+        ]
 
     def __str__(self):
         return f"Review {self.id} ({self.rating})"
+
+
+class BusinessRating(models.Model):
+    """Per-business review count, rating sum and star histogram, maintained on every review write."""
+    business_user = models.OneToOneField(
+        User, on_delete=models.CASCADE, primary_key=True, related_name="rating_summary"
+    )
+    review_count = models.IntegerField(default=0)
+    rating_sum = models.IntegerField(default=0)
+    stars_1 = models.IntegerField(default=0)
+    stars_2 = models.IntegerField(default=0)
+    stars_3 = models.IntegerField(default=0)
+    stars_4 = models.IntegerField(default=0)
+    stars_5 = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"Rating summary of user {self.business_user_id}"
@@ -0,0 +1,85 @@
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+
+from core import aggregates
+from offers_app import cache as offer_list_cache
+from reviews_app.models import BusinessRating, Review
+
+
+STARS = [1, 2, 3, 4, 5]
+AGGREGATE_FIELDS = ["review_count", "rating_sum"] + [f"stars_{star}" for star in STARS]
+
+
+def record_review_change(business_user_id, old_rating, new_rating):
+    """Applies one review write to the business aggregate; None means created or deleted.
+
+    Call inside the transaction that writes the review so both commit together.
+    """
+    if old_rating == new_rating:
+        return
+    deltas = {}
+    for rating, sign in [(old_rating, -1), (new_rating, 1)]:
+        if rating is None:
+            continue
+        deltas["rating_sum"] = deltas.get("rating_sum", 0) + sign * rating
+        deltas["review_count"] = deltas.get("review_count", 0) + sign
+        deltas[f"stars_{rating}"] = sign
+
+    aggregates = BusinessRating.objects.filter(business_user_id=business_user_id)
+    if not aggregates.update(**{field: F(field) + delta for field, delta in deltas.items()}):
+        try:
+            with transaction.atomic():
+                BusinessRating.objects.create(business_user_id=business_user_id, **deltas)
+        except IntegrityError:
+            aggregates.update(**{field: F(field) + delta for field, delta in deltas.items()})
+
+    # Offer lists embed the average rating of each offer's creator.
+    transaction.on_commit(lambda: offer_list_cache.invalidate_creator(business_user_id))
+
+
+def get_average(review_count, rating_sum):
+    if not review_count:
+        return None
+    return round(rating_sum / review_count, 1)
+
+
+def build_summary(aggregate):
+    """Public representation of a BusinessRating; None stands for a business without reviews."""
+    if aggregate is None:
+        return {"review_count": 0, "average_rating": None, "histogram": {str(star): 0 for star in STARS}}
+    return {
+        "review_count": aggregate.review_count,
+        "average_rating": get_average(aggregate.review_count, aggregate.rating_sum),
+        "histogram": {str(star): getattr(aggregate, f"stars_{star}") for star in STARS},
+    }
+
+
+def reconcile():
+    """Recomputes every aggregate from the reviews table and returns how many were wrong."""
+    grouped = Review.objects.order_by().values("business_user", "rating").annotate(total=Count("id"), score=Sum("rating"))
+    repaired = aggregates.reconcile(BusinessRating, AGGREGATE_FIELDS, [(grouped, _aggregate_row)])
+    if repaired:
+        offer_list_cache.invalidate_all()
+    return repaired
+
+
+def _aggregate_row(row):
+    amounts = {"review_count": row["total"], "rating_sum": row["score"]}
+    if row["rating"] in STARS:
+        amounts[f"stars_{row['rating']}"] = row["total"]
+    return amounts
+
+
+def get_summaries(user_ids):
+    """Summaries of the business users among user_ids, keyed by id, read with one joined query."""
+    rows = User.objects.filter(id__in=user_ids, profile__type="business").values(
+        "id", *[f"rating_summary__{field}" for field in AGGREGATE_FIELDS]
+    )
+    summaries = {}
+    for row in rows:
+        aggregate = None
+        if row["rating_summary__review_count"] is not None:
+            aggregate = BusinessRating(**{field: row[f"rating_summary__{field}"] for field in AGGREGATE_FIELDS})
+        summaries[row["id"]] = {"business_user": row["id"], **build_summary(aggregate)}
+    return summaries